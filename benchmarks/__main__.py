@@ -0,0 +1,117 @@
+"""
+Run the benchmarks of typish.
+
+Usage:
+```
+python -m benchmarks [--output FILE] [--compare FILE] [--threshold FRACTION]
+                     [--filter TEXT] [--repeat N]
+```
+The results are written as JSON to ``--output``. With ``--compare``, the
+results are compared to those of a previous run and the exit code is 1 if any
+case became slower by more than ``--threshold``.
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+import typing
+
+from typish import __version__
+
+from benchmarks.cases import get_cases
+
+
+def run(
+        cases: typing.List[typing.Tuple[str, typing.Callable[[], typing.Any]]],
+        repeat: int) -> typing.Dict[str, typing.Any]:
+    """
+    Run the given benchmark cases.
+    :param cases: the cases that are to be run.
+    :param repeat: the number of times each case is measured.
+    :return: the results as a dict that can be dumped as JSON.
+    """
+    results = {}
+    for name, func in cases:
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=number)) / number
+        results[name] = {
+            'seconds_per_call': best,
+            'calls_per_second': 1 / best if best else None,
+            'number': number,
+        }
+        print('{:<45} {:>14.3f} us'.format(name, best * 1e6))
+    return {
+        'typish': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'results': results,
+    }
+
+
+def compare(
+        current: typing.Dict[str, typing.Any],
+        previous: typing.Dict[str, typing.Any],
+        threshold: float) -> typing.List[str]:
+    """
+    Compare the results of two runs.
+    :param current: the results of the current run.
+    :param previous: the results of a previous run.
+    :param threshold: the fraction by which a case may become slower.
+    :return: the names of the cases that became slower than allowed.
+    """
+    regressions = []
+    print('\n{:<45} {:>14} {:>14} {:>8}'.format(
+        'case', 'previous (us)', 'current (us)', 'ratio'))
+    for name, result in current['results'].items():
+        previous_result = previous['results'].get(name)
+        if not previous_result:
+            continue
+        old = previous_result['seconds_per_call']
+        new = result['seconds_per_call']
+        ratio = new / old if old else float('inf')
+        marker = ''
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            marker = ' <-- regression'
+        print('{:<45} {:>14.3f} {:>14.3f} {:>8.2f}{}'.format(
+            name, old * 1e6, new * 1e6, ratio, marker))
+    return regressions
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks', description='Run typish benchmarks.')
+    parser.add_argument('--output', default='benchmark_results.json',
+                        help='the file to write the results to (JSON)')
+    parser.add_argument('--compare', default=None,
+                        help='a results file of a previous run to compare to')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='the allowed slowdown as a fraction (0.1 = 10%%)')
+    parser.add_argument('--filter', default='',
+                        help='only run cases with this text in their name')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='the number of measurements per case')
+    args = parser.parse_args(argv)
+
+    cases = [(name, func) for name, func in get_cases()
+             if args.filter in name]
+    current = run(cases, args.repeat)
+    with open(args.output, 'w') as file:
+        json.dump(current, file, indent=2, sort_keys=True)
+    print('\nResults written to {}'.format(args.output))
+
+    if args.compare:
+        with open(args.compare, 'r') as file:
+            previous = json.load(file)
+        regressions = compare(current, previous, args.threshold)
+        if regressions:
+            print('\n{} case(s) regressed by more than {:.0%}.'
+                  .format(len(regressions), args.threshold))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+The benchmark cases of typish. Each case is a name with a callable without
+arguments that performs the operation that is to be measured once.
+"""
+import typing
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from typish import (
+    ClsDict,
+    Literal,
+    Something,
+    common_ancestor,
+    get_type,
+    instance_of,
+    instance_of_many,
+    subclass_of,
+)
+
+SIZES = {
+    'small': 10,
+    'medium': 1000,
+    'huge': 100000,
+}
+
+
+class _A: pass
+
+
+class _B(_A): pass
+
+
+class _C(_A): pass
+
+
+class _Duck:
+    name = 'duck'
+
+    def quack(self, times: int) -> str:
+        return 'quack' * times
+
+    def walk(self, steps: int) -> None:
+        pass
+
+
+def _handler(event: Dict[str, int], retries: int = 3) -> bool:
+    return True
+
+
+_DuckType = Something['name': str,
+                      'quack': Callable[[int], str],
+                      'walk': Callable[[int], None]]
+
+_Color = Literal[tuple('color{}'.format(i) for i in range(100))]
+
+_NestedHint = Dict[str, List[Dict[str, Tuple[int, ...]]]]
+
+
+def _nested_payload(size: int) -> Dict[str, List[Dict[str, Tuple[int, ...]]]]:
+    return {'key{}'.format(i): [{'a': (1, 2, 3)}, {'b': (4,)}]
+            for i in range(size // 10 or 1)}
+
+
+def _cls_dict() -> ClsDict:
+    # A ClsDict with many plain keys of which the last one matches.
+    keys = [type('Handler{}'.format(i), (), {}) for i in range(40)]
+    body = {key: i for i, key in enumerate(keys)}
+    body[int] = 'int'
+    return ClsDict(body)
+
+
+def get_cases() -> typing.List[typing.Tuple[str, Callable[[], Any]]]:
+    """
+    Return all benchmark cases.
+    :return: a list of tuples with a name and a callable.
+    """
+    cases = []
+    for size_name, size in SIZES.items():
+        ints = list(range(size))
+        mixed = [i if i % 2 else str(i) for i in range(size)]
+        objects = [(_A, _B, _C)[i % 3]() for i in range(size)]
+        nested = _nested_payload(size)
+        colors = ['color{}'.format(i % 100) for i in range(size)]
+        ducks = [_Duck() for _ in range(size // 100 or 1)]
+        records = [{'id': i, 'name': str(i)} for i in range(size)]
+        cases += [
+            ('instance_of/list_of_int/' + size_name,
+             lambda ints=ints: instance_of(ints, List[int])),
+            ('instance_of/list_of_union/' + size_name,
+             lambda mixed=mixed: instance_of(mixed, List[Union[int, str]])),
+            ('instance_of/nested_generic/' + size_name,
+             lambda nested=nested: instance_of(nested, _NestedHint)),
+            ('instance_of/list_of_literal/' + size_name,
+             lambda colors=colors: instance_of(colors, List[_Color])),
+            ('instance_of/list_of_something/' + size_name,
+             lambda ducks=ducks: instance_of(ducks, List[_DuckType])),
+            ('instance_of_many/records/' + size_name,
+             lambda records=records: instance_of_many(
+                 records, Dict[str, Union[int, str]])),
+            ('get_type/list_of_int/' + size_name,
+             lambda ints=ints: get_type(ints)),
+            ('get_type/list_of_union/' + size_name,
+             lambda mixed=mixed: get_type(mixed, use_union=True)),
+            ('get_type/nested_generic/' + size_name,
+             lambda nested=nested: get_type(nested)),
+            ('common_ancestor/objects/' + size_name,
+             lambda objects=objects: common_ancestor(*objects)),
+        ]
+
+    cls_dict = _cls_dict()
+    cases += [
+        ('instance_of/callable',
+         lambda: instance_of(_handler, Callable[[Dict[str, int], int], bool])),
+        ('instance_of/something',
+         lambda: instance_of(_Duck(), _DuckType)),
+        ('instance_of/literal',
+         lambda: instance_of('color99', _Color)),
+        ('subclass_of/nested_generic',
+         lambda: subclass_of(List[Dict[str, _B]], List[Dict[str, _A]])),
+        ('subclass_of/union',
+         lambda: subclass_of(Union[_B, _C], Union[int, _A])),
+        ('subclass_of/something',
+         lambda: subclass_of(_Duck, _DuckType)),
+        ('get_type/callable',
+         lambda: get_type(_handler)),
+        ('cls_dict/getitem',
+         lambda: cls_dict[42]),
+    ]
+    return cases
@@ -1,7 +1,22 @@
-from typing import Type
+import ast
+import asyncio
+import gc
+import linecache
+import sys
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Dict, List, Type
 from unittest import TestCase
+from unittest.mock import patch
 
 from typish import T, hintable
+from typish.decorators._hint_index import (
+    _index_per_filename,
+    _match_by_order,
+    get_module_index,
+)
 
 
 class C:
@@ -42,6 +57,18 @@ class SomeClass:
 
 
 class TestHintable(TestCase):
+    def _exec_source(self, source: str, filename: str, **names) -> dict:
+        # Execute source as if it were a module with the given filename and
+        # names, and return its namespace. The source is made available to
+        # linecache (and typish) for the duration of the test only.
+        linecache.cache[filename] = (len(source), None,
+                                     source.splitlines(True), filename)
+        self.addCleanup(linecache.cache.pop, filename, None)
+        self.addCleanup(_index_per_filename.pop, filename, None)
+        namespace = dict(names)
+        exec(compile(source, filename, 'exec'), namespace)
+        return namespace
+
     def test_hintable(self):
         # Test that a function can be decorated and receives a hint.
 
@@ -152,14 +179,160 @@ class TestHintable(TestCase):
         self.assertEqual(int, x)
         self.assertEqual(str, y)
 
-    def test_multiline_wont_break(self):
-        # Test that multiline code at least doesnt break
+    def test_multiline(self):
+        # Test that a hint is found in a statement that spans multiple lines.
 
-        # This is just too crazy. If you write code like this, you're on your
-        # own.
         x: \
             int \
             = \
             some_func()
+        y: Dict[
+            str,
+            List[int]
+        ] = some_func()
+
+        self.assertEqual(int, x)
+        self.assertEqual(Dict[str, List[int]], y)
+
+    def test_hintable_with_generic_hint(self):
+        # Test that nested generic hints are evaluated.
+
+        x: Dict[str, List[int]] = some_func()
+        y: 'Dict[str, Type[C]]' = some_func()
+        z = some_func()  # type: List[Dict[str, int]]
+
+        self.assertEqual(Dict[str, List[int]], x)
+        self.assertEqual(Dict[str, Type[C]], y)
+        self.assertEqual(List[Dict[str, int]], z)
+
+    def test_hintable_in_a_loop(self):
+        # Test that a call site keeps receiving its hint, without inspecting
+        # the stack.
+
+        with patch('inspect.stack') as stack_mock:
+            for _ in range(3):
+                x: int = some_func(); y: str = some_func()
+
+                self.assertEqual(int, x)
+                self.assertEqual(str, y)
+
+        stack_mock.assert_not_called()
 
-        self.assertEqual(None, x)
+    def test_hintable_cache_is_dropped_with_code(self):
+        # Test that the cached hints of a caller do not outlive its code.
+
+        source = 'def caller():\n    x: int = some_func()\n    return x\n'
+        filename = '<hintable test>'
+        namespace = self._exec_source(source, filename, some_func=some_func)
+        code_ref = weakref.ref(namespace['caller'].__code__)
+
+        self.assertEqual(int, namespace['caller']())
+        del namespace
+        gc.collect()
+
+        self.assertIsNone(code_ref())
+
+    def test_hintable_parses_a_module_once(self):
+        # Test that the source of a caller's module is parsed only once for
+        # all of its call sites.
+
+        source = ('def caller():\n'
+                  '    x: int = some_func()\n'
+                  '    y: str = some_func()\n'
+                  '    return x, y\n')
+        filename = '<hintable parse test>'
+        namespace = self._exec_source(source, filename, some_func=some_func)
+
+        with patch('ast.parse', side_effect=ast.parse) as parse_mock:
+            self.assertEqual((int, str), namespace['caller']())
+            self.assertEqual((int, str), namespace['caller']())
+
+        self.assertEqual(1, parse_mock.call_count)
+
+    def test_hintable_matches_calls_by_order(self):
+        # Test the matching of calls to hints for Pythons before 3.11, which
+        # have no source positions per instruction.
+
+        source = ('def caller():\n'
+                  '    a: int = record(); b: str = record()\n'
+                  '    c: float = len([record(), obj.record()])\n'
+                  '    d: bytes = obj.record(\n'
+                  '        record())\n'
+                  '    e = record()\n')
+        filename = '<hintable order test>'
+        offsets = []
+
+        def record(*_):
+            offsets.append(sys._getframe(1).f_lasti)
+
+        namespace = self._exec_source(source, filename, record=record,
+                                      obj=SimpleNamespace(record=record))
+        namespace['caller']()
+        code = namespace['caller'].__code__
+        calls = get_module_index(code, namespace).calls_per_name['record']
+
+        call_per_offset = _match_by_order(code, 'record', calls)
+        hints = [call_per_offset[offset].get_hint(namespace)
+                 if offset in call_per_offset else None
+                 for offset in offsets]
+
+        self.assertEqual([int, str, float, float, bytes, bytes, None], hints)
+
+    def test_hintable_with_stack_effect_before_python_38(self):
+        # Test that dis.stack_effect is called without jump before Python 3.8.
+
+        with patch('typish.decorators._hint_index.sys') as sys_mock, \
+                patch('dis.stack_effect', return_value=0) as stack_effect:
+            sys_mock.version_info = (3, 7)
+            _match_by_order(self.test_hintable.__code__, 'some_func', [])
+
+        self.assertTrue(stack_effect.called)
+        for call in stack_effect.call_args_list:
+            self.assertEqual({}, call[1])
+
+    def test_hintable_with_concurrent_threads(self):
+        # Test that threads that start on a cold cache at the same time all
+        # receive the right hints.
+
+        source = ('def caller():\n'
+                  '    x: int = some_func(); y = some_func()\n'
+                  '    z = some_func()  # type: str\n'
+                  '    return x, y, z\n')
+        filename = '<hintable thread test>'
+        namespace = self._exec_source(source, filename, some_func=some_func)
+        number_of_threads = 16
+        barrier = threading.Barrier(number_of_threads)
+
+        def hammer():
+            barrier.wait()
+            return {namespace['caller']() for _ in range(1000)}
+
+        with ThreadPoolExecutor(number_of_threads) as executor:
+            futures = [executor.submit(hammer)
+                       for _ in range(number_of_threads)]
+            results = [future.result() for future in futures]
+
+        self.assertEqual([{(int, None, str)}] * number_of_threads, results)
+
+    def test_hintable_with_interleaved_coroutines(self):
+        # Test that coroutines that are suspended in between hintable calls
+        # receive the right hints.
+
+        async def coroutine():
+            x: int = some_func()
+            await asyncio.sleep(0)
+            y: str = some_func()
+            await asyncio.sleep(0)
+            z = some_func()
+            return x, y, z
+
+        async def gather():
+            return await asyncio.gather(*[coroutine() for _ in range(500)])
+
+        loop = asyncio.new_event_loop()
+        try:
+            results = loop.run_until_complete(gather())
+        finally:
+            loop.close()
+
+        self.assertEqual({(int, str, None)}, set(results))
@@ -62,3 +62,50 @@ class TestClsDict(TestCase):
 
         self.assertEqual(1, cd[123])
         self.assertEqual(2, cd['123'])
+
+    def test_getitem_uses_first_match_with_generic_keys(self):
+        cd = ClsDict({
+            List[int]: 1,
+            list: 2,
+            List[str]: 3,
+            object: 4,
+        })
+
+        # Ask twice, so that the second time is served from the index.
+        for _ in range(2):
+            self.assertEqual(1, cd[[1, 2, 3]])
+            self.assertEqual(2, cd[['1', '2', '3']])
+            self.assertEqual(4, cd['123'])
+
+    def test_getitem_after_mutation(self):
+        cd = ClsDict({object: 1})
+        self.assertEqual(1, cd[42])
+
+        cd[int] = 2
+        cd.move_to_end(object)
+        self.assertEqual(2, cd[42])
+
+        del cd[int]
+        self.assertEqual(1, cd[42])
+
+        cd.update({bool: 3})
+        cd.move_to_end(object)
+        self.assertEqual(3, cd[True])
+
+        cd.pop(bool)
+        self.assertEqual(1, cd[True])
+
+        cd.clear()
+        with self.assertRaises(KeyError):
+            cd[42]
+
+        cd.setdefault(int, 4)
+        self.assertEqual(4, cd[42])
+
+    def test_getitem_without_match_is_indexed(self):
+        cd = ClsDict({int: 1, List[str]: 2})
+
+        for _ in range(2):
+            with self.assertRaises(KeyError):
+                cd[4.2]
+            self.assertEqual(2, cd[['4.2']])
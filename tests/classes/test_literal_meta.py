@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from typish import LiteralAlias
+from typish import Literal, LiteralAlias, instance_of
 
 
 class TestLiteralMeta(TestCase):
@@ -23,3 +23,26 @@ class TestLiteralMeta(TestCase):
         self.assertTrue(isinstance(2, LiteralAlias[(1, 2)]))
         self.assertTrue(isinstance(1, LiteralAlias[((1, 2),)]))
         self.assertTrue(isinstance(2, LiteralAlias[((1, 2),)]))
+
+    def test_booleans_are_not_numbers(self):
+        self.assertFalse(isinstance(1, LiteralAlias[True]))
+        self.assertFalse(isinstance(True, LiteralAlias[1]))
+        self.assertTrue(isinstance(True, LiteralAlias[True, 1]))
+        self.assertFalse(instance_of(1, Literal[True]))
+        self.assertFalse(instance_of(False, Literal[0]))
+        self.assertTrue(instance_of(0, Literal[0]))
+
+    def test_unhashable_values(self):
+        alias = LiteralAlias[[1, 2], 'a']
+
+        self.assertTrue(isinstance([1, 2], alias))
+        self.assertTrue(isinstance('a', alias))
+        self.assertFalse(isinstance([1], alias))
+        self.assertFalse(isinstance({}, alias))
+
+    def test_many_values(self):
+        alias = LiteralAlias[tuple(range(1000))]
+
+        self.assertTrue(isinstance(999, alias))
+        self.assertFalse(isinstance(1000, alias))
+        self.assertEqual(tuple(range(1000)), alias.__args__)
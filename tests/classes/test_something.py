@@ -1,8 +1,9 @@
-from typing import Callable, List, Set
+from typing import Callable, Coroutine, Generator, Iterable, List, Set, Sized
 from unittest import TestCase
+from unittest.mock import patch
 
 from test_resources import some_module
-from typish import Something, TypingType
+from typish import Something, TypingType, subclass_of
 
 Inyerface = Something[{
     'a': int,
@@ -96,3 +97,92 @@ class TestSomething(TestCase):
         # If the lines below raise no errors, the test succeeds.
         hash(Something['abc': int])
         L = List[Something['abc': int]]
+
+    def test_something_signature_is_computed_once(self):
+        # A key that no other test uses, so that the subscription is not
+        # served from the interned subscriptions of other tests.
+        with patch('typish.classes._something._to_signature',
+                   side_effect=lambda args: {'once': int}) as to_signature_mock:
+            something = Something['once': int]
+            isinstance(C1(), something)
+            isinstance(C2(), something)
+            something.signature()
+
+        self.assertEqual(1, to_signature_mock.call_count)
+
+    def test_something_signature_returns_a_copy(self):
+        something = Something['a': int]
+        something.signature()['b'] = str
+
+        self.assertDictEqual({'a': int}, something.signature())
+
+    def test_something_subclass_check_with_method_signatures(self):
+        # Methods are matched with contravariant parameters and may have
+        # extra parameters with defaults.
+        class WithDefault:
+            def b(self, a: int, b: object, c: bool = False) -> str:
+                ...
+
+        class Narrower:
+            def b(self, a: int, b: bool) -> str:
+                ...
+
+        class Inherited(WithDefault):
+            a = 42
+
+        something = Something['b': Callable[[int, int], str]]
+
+        self.assertTrue(issubclass(WithDefault, something))
+        self.assertFalse(issubclass(Narrower, something))
+        self.assertTrue(issubclass(Inherited, Inyerface))
+
+    def test_something_subclass_check_is_cached(self):
+        something = Something['a': int, 'b': Callable[[int, int], str]]
+        with patch.object(Something, 'like',
+                          wraps=Something.like) as like_mock:
+            self.assertTrue(issubclass(C1, something))
+            self.assertTrue(issubclass(C1, something))
+            self.assertFalse(issubclass(C4, something))
+
+        self.assertEqual(2, like_mock.call_count)
+
+    def test_something_like(self):
+        self.assertEqual(Something['a': int, 'b': Callable[[int, int], str]],
+                         Something.like(C2()))
+
+    def test_something_like_lazy(self):
+        class Heavy:
+            a = 42
+
+            @property
+            def b(self) -> str:
+                raise AssertionError('b should not be evaluated')
+
+        something = Something.like(Heavy(), lazy=True)
+
+        self.assertIn('b', something._signature)
+        self.assertTrue(issubclass(Heavy, Something['a': int]))
+        self.assertTrue(subclass_of(something._signature['a'], int))
+
+    def test_something_like_lazy_equals_eager(self):
+        self.assertEqual(Something.like(C2()), Something.like(C2(), lazy=True))
+        self.assertTrue(isinstance(C2(), Something.like(C2(), lazy=True)))
+
+    def test_something_like_exclude_descriptors(self):
+        class Heavy:
+            a = 42
+
+            @property
+            def b(self) -> str:
+                raise AssertionError('b should not be evaluated')
+
+        something = Something.like(Heavy(), exclude_descriptors=True)
+
+        self.assertEqual(Something['a': int], something)
+
+    def test_something_subclass_of_abcs(self):
+        # An ABC compares the subscripted Something with the bare Something.
+        for abc in (Iterable, Sized, Coroutine, Generator):
+            self.assertFalse(subclass_of(Something['x': int], abc), abc)
+        self.assertNotEqual(Something, Something['x': int])
+        self.assertEqual('typish.Something', repr(Something))
@@ -1,6 +1,14 @@
+import gc
+import pickle
+import weakref
+from typing import Callable
 from unittest import TestCase
 
-from typish import SubscriptableType
+from typish import SubscriptableType, Something, LiteralAlias
+
+
+class PicklableType(metaclass=SubscriptableType):
+    ...
 
 
 class TestSubscriptableType(TestCase):
@@ -27,3 +35,63 @@ class TestSubscriptableType(TestCase):
 
         self.assertEqual(SomeType['test'], SomeType['test'])
         self.assertNotEqual(SomeType['test1'], SomeType['test2'])
+
+    def test_pickle(self):
+        for subscripted in (PicklableType['test'],
+                            LiteralAlias[1, 2],
+                            Something['a': int, 'b': Callable[[int], str]]):
+            self.assertEqual(subscripted, pickle.loads(pickle.dumps(subscripted)))
+
+        for cls in (PicklableType, LiteralAlias, Something):
+            self.assertIs(cls, pickle.loads(pickle.dumps(cls)))
+
+    def test_subscriptions_are_interned(self):
+        self.assertIs(LiteralAlias['a'], LiteralAlias['a'])
+        self.assertIs(Something['x': int], Something['x': int])
+        self.assertIs(Something[{'x': int}], Something[{'x': int}])
+
+    def test_interning_tells_apart_equal_args_of_other_types(self):
+        self.assertIsNot(LiteralAlias[1], LiteralAlias[True])
+        self.assertEqual((True,), LiteralAlias[True].__args__)
+
+    def test_interning_with_mutated_args(self):
+        class C(metaclass=SubscriptableType):
+            ...
+
+        args = [1]
+        C1 = C[args]
+        args.append(2)
+
+        self.assertIsNot(C1, C[[1]])
+        self.assertEqual([1], C[[1]].__args__)
+        self.assertIs(C[[1]], C[[1]])
+        self.assertEqual({'x': [int]}, C[{'x': [int]}].__args__)
+
+    def test_interned_subscriptions_can_be_collected(self):
+        class C(metaclass=SubscriptableType):
+            ...
+
+        ref = weakref.ref(C['arg'])
+        gc.collect()
+
+        self.assertIsNone(ref())
+
+    def test_unhashable_subscriptions(self):
+        class C(metaclass=SubscriptableType):
+            ...
+
+        subscribed = C[[{'a': [1]}]]
+
+        self.assertEqual([{'a': [1]}], subscribed.__args__)
+        self.assertEqual(hash(subscribed), hash(C[[{'a': [1]}]]))
+
+    def test_unsubscribed_types_are_not_equal(self):
+        class C1(metaclass=SubscriptableType):
+            ...
+
+        class C2(metaclass=SubscriptableType):
+            ...
+
+        self.assertNotEqual(C1, C2)
+        self.assertIsNot(C1['arg'], C2['arg'])
+        self.assertNotEqual(C1['arg'], C2['arg'])
@@ -0,0 +1,157 @@
+import copy
+import pickle
+from typing import Any, Dict, List
+from unittest import TestCase
+from unittest.mock import patch
+
+from typish import Something, ValidatedDict, ValidatedList, instance_of
+
+Named = Something['name': str]
+
+
+class Person:
+    def __init__(self, name):
+        self.name = name
+
+
+class TestValidatedList(TestCase):
+    def test_validated_list(self):
+        validated = ValidatedList(List[int], [1, 2, 3])
+
+        self.assertTrue(validated.is_valid)
+        self.assertListEqual([1, 2, 3], validated)
+        self.assertTrue(instance_of(validated, List[int]))
+
+    def test_mutations(self):
+        validated = ValidatedList(List[int], [1, 2, 3])
+
+        validated.append('4')
+        self.assertFalse(validated.is_valid)
+        validated.pop()
+        self.assertTrue(validated.is_valid)
+        validated.insert(0, None)
+        self.assertFalse(validated.is_valid)
+        validated[0] = 0
+        self.assertTrue(validated.is_valid)
+        validated[1:3] = ['a', 'b', 'c']
+        self.assertFalse(validated.is_valid)
+        del validated[1:3]
+        self.assertFalse(validated.is_valid)
+        validated.remove('c')
+        self.assertTrue(validated.is_valid)
+        validated += [1.0]
+        self.assertFalse(validated.is_valid)
+        del validated[-1]
+        self.assertTrue(validated.is_valid)
+        validated.extend(['x'])
+        validated *= 2
+        self.assertEqual(2, validated._invalid_count)
+        validated.clear()
+        self.assertTrue(validated.is_valid)
+
+    def test_sort_and_reverse_keep_verdict(self):
+        validated = ValidatedList(List[int], [3, 1, 2])
+        validated.append('x')
+        validated.sort(key=str, reverse=True)
+        validated.reverse()
+
+        self.assertListEqual([1, 2, 3, 'x'], validated)
+        validated.pop()
+        self.assertTrue(validated.is_valid)
+        validated.pop(0)
+        self.assertTrue(validated.is_valid)
+
+    def test_only_changes_are_checked(self):
+        validated = ValidatedList(List[int], range(1000))
+        with patch.object(validated, '_check', wraps=validated._check) as check_mock:
+            validated.append(1000)
+            validated[5] = 5
+
+        self.assertEqual(2, check_mock.call_count)
+
+    def test_revalidate(self):
+        validated = ValidatedList(List[List[int]], [[1]])
+        validated[0].append('a')
+
+        self.assertTrue(validated.is_valid)
+        self.assertFalse(validated.revalidate())
+
+    def test_with_something(self):
+        validated = ValidatedList(List[Named], [Person('a')])
+
+        validated.append(Person(1))
+        self.assertFalse(validated.is_valid)
+
+    def test_without_args(self):
+        validated = ValidatedList(list, [1, 'a'])
+
+        self.assertTrue(validated.is_valid)
+
+    def test_invalid_hint(self):
+        with self.assertRaises(TypeError):
+            ValidatedList(Dict[str, int])
+
+    def test_pickle_and_copy(self):
+        validated = ValidatedList(List[int], [1, 'a'])
+
+        for copied in (pickle.loads(pickle.dumps(validated)),
+                       copy.deepcopy(validated)):
+            self.assertListEqual([1, 'a'], copied)
+            self.assertEqual(List[int], copied.hint)
+            self.assertFalse(copied.is_valid)
+
+
+class TestValidatedDict(TestCase):
+    def test_validated_dict(self):
+        validated = ValidatedDict(Dict[str, int], {'a': 1}, b=2)
+
+        self.assertTrue(validated.is_valid)
+        self.assertDictEqual({'a': 1, 'b': 2}, validated)
+        self.assertTrue(instance_of(validated, Dict[str, int]))
+
+    def test_mutations(self):
+        validated = ValidatedDict(Dict[str, int])
+
+        validated['a'] = 'x'
+        self.assertFalse(validated.is_valid)
+        validated['a'] = 1
+        self.assertTrue(validated.is_valid)
+        validated[1] = 1
+        self.assertFalse(validated.is_valid)
+        del validated[1]
+        self.assertTrue(validated.is_valid)
+        validated.update([('b', None)], c=3)
+        self.assertFalse(validated.is_valid)
+        validated.pop('b')
+        self.assertTrue(validated.is_valid)
+        validated.setdefault('d')
+        self.assertFalse(validated.is_valid)
+        validated.popitem()
+        self.assertTrue(validated.is_valid)
+        validated |= {'e': 'x'}
+        self.assertFalse(validated.is_valid)
+        validated.clear()
+        self.assertTrue(validated.is_valid)
+
+    def test_with_something(self):
+        validated = ValidatedDict(Dict[str, Named], a=Person('a'))
+        self.assertTrue(validated.is_valid)
+
+        validated['b'] = Person(None)
+        self.assertFalse(validated.is_valid)
+
+    def test_revalidate(self):
+        validated = ValidatedDict(Dict[str, Any], a=[1])
+
+        self.assertTrue(validated.revalidate())
+
+    def test_invalid_hint(self):
+        with self.assertRaises(TypeError):
+            ValidatedDict(List[int])
+
+    def test_pickle(self):
+        validated = ValidatedDict(Dict[str, int], a='x')
+        copied = pickle.loads(pickle.dumps(validated))
+
+        self.assertDictEqual({'a': 'x'}, copied)
+        self.assertFalse(copied.is_valid)
@@ -0,0 +1,163 @@
+from functools import partial
+from types import MethodType
+from typing import Any, Awaitable, Callable, List
+from unittest import TestCase
+from unittest.mock import patch
+
+from typish import NoneType, Unknown, instance_of, subclass_of
+from typish.functions._callable_compatibility import (
+    get_shape,
+    is_callable_compatible,
+    is_shape_compatible,
+)
+
+
+class A: pass
+class B(A): pass
+
+
+class TestCallableCompatibility(TestCase):
+    def test_parameters_are_contravariant(self):
+        def func(x: A) -> None:
+            ...
+
+        self.assertTrue(is_callable_compatible(func, Callable[[A], None]))
+        self.assertTrue(is_callable_compatible(func, Callable[[B], None]))
+        self.assertFalse(is_callable_compatible(func, Callable[[object], None]))
+
+    def test_return_type_is_covariant(self):
+        def func() -> B:
+            ...
+
+        self.assertTrue(is_callable_compatible(func, Callable[[], A]))
+        self.assertTrue(is_callable_compatible(func, Callable[[], B]))
+        self.assertFalse(is_callable_compatible(func, Callable[[], int]))
+
+    def test_ellipsis_and_bare_callable(self):
+        def func(x: int, y: str) -> B:
+            ...
+
+        self.assertTrue(is_callable_compatible(func, Callable[..., A]))
+        self.assertFalse(is_callable_compatible(func, Callable[..., int]))
+        self.assertTrue(is_callable_compatible(func, Callable))
+
+    def test_defaults_and_keywords(self):
+        def with_default(x: int, y: int = 0) -> None:
+            ...
+
+        def with_var_positional(x: int, *args: str) -> None:
+            ...
+
+        def with_keyword_only(x: int, *, y: int) -> None:
+            ...
+
+        def with_keyword_only_default(x: int, *, y: int = 0) -> None:
+            ...
+
+        self.assertTrue(is_callable_compatible(with_default, Callable[[int], None]))
+        self.assertTrue(is_callable_compatible(with_default, Callable[[int, bool], None]))
+        self.assertFalse(is_callable_compatible(with_default, Callable[[], None]))
+        self.assertFalse(is_callable_compatible(with_default, Callable[[int, int, int], None]))
+        self.assertTrue(is_callable_compatible(with_var_positional, Callable[[int, str, str], None]))
+        self.assertFalse(is_callable_compatible(with_var_positional, Callable[[int, int], None]))
+        self.assertFalse(is_callable_compatible(with_keyword_only, Callable[[int], None]))
+        self.assertTrue(is_callable_compatible(with_keyword_only_default, Callable[[int], None]))
+
+    def test_unannotated_lambda_and_coroutine(self):
+        def unannotated(x):
+            ...
+
+        async def coroutine(x: int) -> str:
+            ...
+
+        self.assertTrue(is_callable_compatible(unannotated, Callable[[List[int]], None]))
+        self.assertTrue(is_callable_compatible(lambda x: x, Callable[[int], str]))
+        self.assertTrue(is_callable_compatible(coroutine, Callable[[int], Awaitable[str]]))
+        self.assertFalse(is_callable_compatible(coroutine, Callable[[int], str]))
+
+    def test_string_annotations_are_resolved(self):
+        def func(x: 'A') -> 'B':
+            ...
+
+        parameters, return_type = get_shape(func)
+
+        self.assertEqual(A, parameters[0][1])
+        self.assertEqual(B, return_type)
+        self.assertTrue(is_callable_compatible(func, Callable[[B], A]))
+
+    def test_results_are_memoized(self):
+        def func(x: A) -> B:
+            ...
+
+        with patch('typish.functions._callable_compatibility.subclass_of',
+                   side_effect=subclass_of) as subclass_of_mock:
+            for _ in range(3):
+                is_callable_compatible(func, Callable[[B], A])
+
+        self.assertEqual(2, subclass_of_mock.call_count)
+
+    def test_shape_ignores_names_and_default_values(self):
+        def func1(x: int, y: list = []) -> None:
+            ...
+
+        def func2(a: int, b: list = None) -> None:
+            ...
+
+        self.assertEqual(get_shape(func1), get_shape(func2))
+        self.assertTrue(is_shape_compatible(get_shape(func1), (int,), NoneType))
+
+    def test_subclass_of_callable(self):
+        self.assertTrue(subclass_of(Callable[[A], B], Callable[[B], A]))
+        self.assertFalse(subclass_of(Callable[[B], B], Callable[[A], A]))
+        self.assertTrue(subclass_of(Callable[..., B], Callable[[int], A]))
+        self.assertTrue(subclass_of(Callable[[int], B], Callable[..., A]))
+        self.assertTrue(subclass_of(Callable[[Unknown], Unknown], Callable[[int], str]))
+        self.assertFalse(subclass_of(Callable[[int], B], Callable[[int, int], A]))
+        self.assertTrue(subclass_of(Callable[[object], Any], Callable[[int], Any]))
+
+    def test_instance_of_method(self):
+        class C:
+            def method(self, x: A, y: int = 0) -> B:
+                ...
+
+        self.assertTrue(instance_of(C().method, Callable[[B], A]))
+        self.assertFalse(instance_of(C().method, Callable[[object], A]))
+
+    def test_instance_of_methods_of_other_callables(self):
+        def func(x: int, y: str) -> int:
+            ...
+
+        self.assertTrue(instance_of(MethodType(partial(func), 1), Callable[[str], int]))
+        self.assertFalse(instance_of(MethodType(partial(func), 1), Callable[[int], int]))
+        self.assertFalse(instance_of(MethodType(len, []), Callable[[str], int]))
+
+    def test_any_is_compatible_with_anything(self):
+        class C:
+            def method(self, a: A) -> B:
+                ...
+
+        def f(a: A) -> B:
+            ...
+
+        def g(a: Any) -> Any:
+            ...
+
+        def h(*args: int):
+            ...
+
+        self.assertTrue(instance_of(f, Callable[[Any], Any]))
+        self.assertTrue(instance_of(C().method, Callable[[Any], Any]))
+        self.assertTrue(instance_of(h, Callable[[Any], Any]))
+        self.assertTrue(instance_of(h, Callable[[Any, Any], None]))
+        self.assertTrue(instance_of(g, Callable[[int], str]))
+        self.assertFalse(instance_of(f, Callable[[Any, Any], Any]))
+        self.assertTrue(subclass_of(Callable[[A], B], Callable[[Any], Any]))
+        self.assertTrue(subclass_of(Callable[[Any], Any], Callable[[int], str]))
+
+    def test_subclass_of_callable_with_other_types(self):
+        # Classes and a bare Callable are checked like any other generic.
+        self.assertTrue(instance_of(int, Callable[[], int]))
+        self.assertFalse(instance_of(str, Callable[[], int]))
+        self.assertTrue(instance_of(int, Callable))
+        self.assertTrue(subclass_of(Callable[[int], str], Callable))
+        self.assertFalse(subclass_of(Callable, Callable[[int], str]))
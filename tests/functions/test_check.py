@@ -0,0 +1,88 @@
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from unittest import TestCase
+
+from typish import (
+    CheckFailure,
+    Literal,
+    State,
+    check,
+    compile,
+    register_get_type,
+)
+
+
+class TestCheck(TestCase):
+    def test_check_valid(self):
+        self.assertListEqual([], check([1, 2, 3], List[int]))
+        self.assertListEqual([], check({'a': (1, 'b')}, Dict[str, Tuple[int, str]]))
+        self.assertListEqual([], check(42, Any))
+
+    def test_check_first_failure(self):
+        failures = check({'a': [1, 2, '3', '4']}, Dict[str, List[int]])
+
+        self.assertListEqual([CheckFailure('$.a[2]', int, str)], failures)
+
+    def test_check_with_limit(self):
+        obj = ['a', 2, 'c', 'd']
+
+        self.assertEqual(2, len(check(obj, List[int], limit=2)))
+        self.assertListEqual([CheckFailure('$[0]', int, str),
+                              CheckFailure('$[2]', int, str),
+                              CheckFailure('$[3]', int, str)],
+                             check(obj, List[int], limit=None))
+
+    def test_check_paths(self):
+        obj = {'users': [{'name': 'x', 'first name': 1}], 3: 'y'}
+        hint = Dict[str, List[Dict[str, str]]]
+
+        failures = check(obj, hint, limit=None)
+
+        self.assertListEqual(["$.users[0]['first name']", '$[3]~', '$[3]'],
+                             [failure.path for failure in failures])
+        self.assertEqual(str, failures[1].expected)
+        self.assertEqual(List[Dict[str, str]], failures[2].expected)
+
+    def test_check_tuples(self):
+        self.assertListEqual([CheckFailure('$[1]', str, int)],
+                             check((1, 2), Tuple[int, str]))
+        self.assertListEqual([CheckFailure('$', Tuple[int, str], tuple)],
+                             check((1,), Tuple[int, str]))
+        self.assertListEqual([CheckFailure('$[2]', int, float)],
+                             check((1, 2, 3.0), Tuple[int, ...]))
+
+    def test_check_wrong_container(self):
+        self.assertListEqual([CheckFailure('$', List[int], set)],
+                             check({1, 2}, List[int]))
+        self.assertListEqual([CheckFailure('$', Set[int], type(None))],
+                             check(None, Set[int]))
+
+    def test_check_union(self):
+        self.assertListEqual([CheckFailure('$[1]', int, str)],
+                             check([1, 'a'], Optional[List[int]]))
+        self.assertListEqual([CheckFailure('$', Union[int, str], float)],
+                             check(1.0, Union[int, str]))
+
+    def test_check_literal(self):
+        self.assertListEqual([CheckFailure('$[1]', Literal['a', 'b'], str)],
+                             check(['a', 'c'], List[Literal['a', 'b']]))
+
+    def test_check_with_registered_get_type(self):
+        state = State()
+        register_get_type(list, lambda _: List[str], state=state)
+
+        self.assertListEqual([], check([1], List[str], state=state))
+
+    def test_check_with_checker(self):
+        checker = compile(List[int])
+
+        self.assertListEqual([CheckFailure('$[0]', int, str)], checker.check(['a']))
+
+    def test_check_invalid_limit(self):
+        with self.assertRaises(ValueError):
+            check([], List[int], limit=0)
+
+    def test_check_failure_str(self):
+        failure = CheckFailure('$.a', int, str)
+
+        self.assertEqual("$.a: expected <class 'int'>, got <class 'str'>", str(failure))
+        self.assertIn("path='$.a'", repr(failure))
@@ -1,5 +1,6 @@
 from typing import Type
 from unittest import TestCase
+from unittest.mock import patch
 
 from typish import common_ancestor, common_ancestor_of_types, NoneType
 
@@ -35,3 +36,24 @@ class TestCommonAncestor(TestCase):
     def test_invalid(self):
         with self.assertRaises(TypeError):
             common_ancestor()
+        with self.assertRaises(TypeError):
+            common_ancestor_of_types()
+
+    def test_common_ancestor_of_many_objects(self):
+        objects = [(C, D, E)[i % 3]() for i in range(1000)]
+
+        with patch('typish.functions._common_ancestor.get_mro',
+                   side_effect=lambda cls: cls.__mro__) as get_mro_mock:
+            result = common_ancestor(*objects)
+
+        self.assertEqual(C, result)
+        self.assertLessEqual(get_mro_mock.call_count, 3)
+
+    def test_common_ancestor_after_changing_bases(self):
+        class X: pass
+        class Y: pass
+        class Z(X): pass
+
+        self.assertEqual(X, common_ancestor_of_types(Z, X))
+        Z.__bases__ = (Y,)
+        self.assertEqual(object, common_ancestor_of_types(Z, X))
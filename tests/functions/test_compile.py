@@ -0,0 +1,124 @@
+from collections import deque
+from typing import (
+    List,
+    Dict,
+    Union,
+    Optional,
+    Callable,
+    Any,
+    Tuple,
+    Type,
+    Iterable,
+    Set,
+    Deque,
+)
+from unittest import TestCase
+
+from typish import (
+    Checker,
+    Literal,
+    Something,
+    State,
+    compile,
+    register_get_type,
+)
+
+
+class A: pass
+
+
+class B(A): pass
+
+
+class TestCompile(TestCase):
+    def test_compile_returns_checker(self):
+        checker = compile(List[int])
+
+        self.assertTrue(isinstance(checker, Checker))
+        self.assertEqual(List[int], checker.hint)
+        self.assertEqual('typish.Checker[typing.List[int]]', repr(checker))
+
+    def test_compile_classes(self):
+        self.assertTrue(compile(int)(42))
+        self.assertTrue(compile(A)(B()))
+        self.assertTrue(compile(object)('anything'))
+        self.assertTrue(compile(Any)(None))
+        self.assertTrue(not compile(B)(A()))
+        self.assertTrue(not compile(float)(42))
+
+    def test_compile_collections(self):
+        self.assertTrue(compile(List[int])([1, 2, 3]))
+        self.assertTrue(compile(List[int])([]))
+        self.assertTrue(compile(Set[int])({1, 2, 3}))
+        self.assertTrue(compile(Deque[int])(deque([1, 2, 3])))
+        self.assertTrue(compile(Iterable[int])((1, 2, 3)))
+        self.assertTrue(compile(List[List[int]])([[1], [2, 3]]))
+        self.assertTrue(not compile(List[int])([1, 2, '3']))
+        self.assertTrue(not compile(List[int])((1, 2, 3)))
+        self.assertTrue(not compile(List[int])(42))
+
+    def test_compile_dicts(self):
+        checker = compile(Dict[str, List[int]])
+
+        self.assertTrue(checker({'a': [1, 2], 'b': []}))
+        self.assertTrue(checker({}))
+        self.assertTrue(not checker({'a': [1, '2']}))
+        self.assertTrue(not checker({1: [1, 2]}))
+        self.assertTrue(not checker([('a', [1, 2])]))
+
+    def test_compile_tuples(self):
+        self.assertTrue(compile(Tuple[int, str])((1, '2')))
+        self.assertTrue(compile(Tuple[int, ...])((1, 2, 3)))
+        self.assertTrue(compile(Tuple[int, ...])(()))
+        self.assertTrue(compile(Tuple[Union[int, str], ...])((1, '2', 3)))
+        self.assertTrue(not compile(Tuple[int, str])((1, 2)))
+        self.assertTrue(not compile(Tuple[int, str])((1, '2', 3)))
+        self.assertTrue(not compile(Tuple[int, ...])([1, 2, 3]))
+
+    def test_compile_unions(self):
+        self.assertTrue(compile(Union[int, str])('42'))
+        self.assertTrue(compile(Optional[int])(None))
+        self.assertTrue(compile(List[Union[int, str]])([1, '2', 3]))
+        self.assertTrue(compile(List[List[Union[int, str]]])([[1, '2']]))
+        self.assertTrue(not compile(Union[int, str])(4.2))
+
+    def test_compile_literals(self):
+        self.assertTrue(compile(Literal[42])(42))
+        self.assertTrue(compile(Literal['a', 'b'])('b'))
+        self.assertTrue(compile(List[Literal['a', 'b']])(['a', 'b', 'a']))
+        self.assertTrue(not compile(Literal[42])(43))
+        self.assertTrue(not compile(List[Literal['a', 'b']])(['a', 'c']))
+
+    def test_compile_something(self):
+        class C:
+            a = 42
+
+        checker = compile(List[Something['a': int]])
+
+        self.assertTrue(checker([C(), C()]))
+        self.assertTrue(not checker([C(), 42]))
+
+    def test_compile_callables(self):
+        def func(x: int) -> str:
+            pass
+
+        self.assertTrue(compile(Callable)(func))
+        self.assertTrue(compile(Callable[[int], str])(func))
+        self.assertTrue(not compile(Callable[[str], str])(func))
+        self.assertTrue(not compile(Callable[[int], str])(42))
+
+    def test_compile_type(self):
+        self.assertTrue(compile(Type[int])(int))
+        self.assertTrue(not compile(Type[int])(str))
+
+    def test_compile_with_state(self):
+        class Wrapper:
+            def __init__(self, value):
+                self.value = value
+
+        local_state = State()
+        register_get_type(Wrapper, lambda _: int, local_state)
+        checker = compile(List[int], state=local_state)
+
+        self.assertTrue(checker([1, Wrapper('2')]))
+        self.assertTrue(not compile(List[int])([1, Wrapper('2')]))
@@ -1,9 +1,13 @@
+import pickle
+from inspect import getmro
 from typing import Dict, Set, List, Tuple, Type, Callable, Any, Awaitable, Union
 from unittest import TestCase
+from unittest.mock import patch
 
 import numpy
 
-from typish import get_type, instance_of, NoneType, Unknown
+from typish import get_sampled_type, get_type, instance_of, NoneType, Unknown, State, register_get_type
+from typish.functions._get_type import _resolve_handler
 
 
 class TestGetType(TestCase):
@@ -67,6 +71,22 @@ class TestGetType(TestCase):
         self.assertEqual(Callable[[Unknown, Unknown], Unknown], get_type(lambda x, y: 42))
         self.assertEqual(Callable[[], Unknown], get_type(lambda: 42))
 
+    def test_get_type_function_named_like_lambda(self):
+
+        def lambda_handler(x: int) -> str:
+            return '42'
+
+        self.assertEqual(Callable[[int], str], get_type(lambda_handler))
+
+    def test_get_type_callable_with_changed_annotations(self):
+
+        def func(x: int) -> str:
+            return '42'
+
+        self.assertEqual(Callable[[int], str], get_type(func))
+        func.__annotations__['x'] = float
+        self.assertEqual(Callable[[float], str], get_type(func))
+
     def test_get_type_deep(self):
         self.assertEqual(List[List[int]], get_type([[1, 2], [3]]))
         self.assertEqual(List[List[object]], get_type([[1, 2], ['3']]))
@@ -101,3 +121,135 @@ class TestGetType(TestCase):
     def test_get_type_of_ndarray(self):
         arr_type = get_type(numpy.array([1, 2, 3]))
         self.assertEqual(numpy.ndarray, arr_type)
+
+    def test_get_type_with_sample(self):
+        inspected = []
+
+        class Spy:
+            def __init__(self, value):
+                self.value = value
+
+        def spy_get_type(spy):
+            inspected.append(spy)
+            return Spy
+
+        local_state = State()
+        register_get_type(Spy, spy_get_type, local_state)
+        spies = [Spy(i) for i in range(1000)]
+
+        self.assertEqual(List[Union[Spy]], get_type(spies, True, state=local_state, sample=10))
+        self.assertEqual(10, len(inspected))
+        self.assertEqual(spies[:5], inspected[:5])
+        # The rest is picked at a fixed stride, so the result is repeatable.
+        self.assertEqual([spies[i] for i in (5, 204, 403, 602, 801)], inspected[5:])
+
+    def test_get_type_with_sample_is_approximate(self):
+        self.assertEqual(Set[int], get_type(set(range(1000)), sample=5))
+        self.assertEqual(Dict[str, List[int]], get_type({str(i): [i] * 100 for i in range(100)}, sample=5))
+        self.assertEqual(List[object], get_type([1, '2', 3], sample=5))
+
+    def test_get_type_with_invalid_sample(self):
+        with self.assertRaises(ValueError):
+            get_type([1, 2, 3], sample=0)
+        with self.assertRaises(ValueError):
+            get_sampled_type([1, 2, 3], 0)
+
+    def test_get_sampled_type(self):
+        self.assertEqual((List[int], True), get_sampled_type(list(range(1000)), 10))
+        self.assertEqual((List[int], False), get_sampled_type(list(range(10)), 10))
+        self.assertEqual((List[List[int]], True), get_sampled_type([[1] * 20], 10))
+        self.assertEqual((Dict[str, int], True), get_sampled_type({str(i): i for i in range(20)}, 10))
+        self.assertEqual((Set[int], False), get_sampled_type(set(range(10)), 10))
+
+    def test_get_type_with_sample_is_deterministic(self):
+        inst = [1] * 500 + ['2'] + [3] * 499
+
+        self.assertEqual({get_type(inst, sample=10)},
+                         {get_type(inst, sample=10) for _ in range(20)})
+
+    def test_get_type_infers_leaf_types_once(self):
+        with patch('typish.functions._get_type.get_type', wraps=get_type) as spy:
+            self.assertEqual(List[int], get_type([1] * 1000))
+            self.assertEqual(List[Union[int, str]], get_type([1, '2'] * 1000, True))
+
+        # Once for int in the first list and once for int and str in the second.
+        self.assertEqual(3, spy.call_count)
+
+    def test_get_type_resolves_handler_once_per_class(self):
+        class SomeIterable:
+            def __iter__(self):
+                return iter([1, 2, 3])
+
+        with patch('typish.functions._get_type._resolve_handler', wraps=_resolve_handler) as spy:
+            self.assertEqual(SomeIterable, get_type(SomeIterable()))
+            self.assertEqual(SomeIterable, get_type(SomeIterable()))
+
+        self.assertEqual(1, spy.call_count)
+
+    def test_get_type_with_registered_type(self):
+        local_state = State()
+        register_get_type(list, lambda _: 'registered', local_state)
+
+        self.assertEqual('registered', get_type([1, 2, 3], state=local_state))
+        self.assertEqual(List[int], get_type([1, 2, 3]))
+
+    def test_get_type_with_registered_super_type(self):
+        class Base:
+            pass
+
+        class Sub(Base):
+            pass
+
+        class SubSub(Sub):
+            pass
+
+        local_state = State()
+        register_get_type(Base, lambda _: 'base', local_state)
+        register_get_type(Sub, lambda _: 'sub', local_state)
+
+        self.assertEqual('base', get_type(Base(), state=local_state))
+        self.assertEqual('sub', get_type(Sub(), state=local_state))
+        self.assertEqual('sub', get_type(SubSub(), state=local_state))
+        self.assertEqual(SubSub, get_type(SubSub()))
+
+    def test_get_type_with_registered_type_after_dispatch(self):
+        # A registration is respected for a class of which the handler was
+        # already resolved and cached.
+        class SomeList(list):
+            pass
+
+        local_state = State()
+        self.assertNotEqual(str, get_type(SomeList([1]), state=local_state))
+        register_get_type(list, lambda _: str, local_state)
+
+        self.assertEqual(str, get_type(SomeList([1]), state=local_state))
+        self.assertTrue(instance_of(SomeList([1]), str, state=local_state))
+
+    def test_get_type_resolves_registered_type_once_per_class(self):
+        class Base:
+            pass
+
+        class Sub(Base):
+            pass
+
+        local_state = State()
+        register_get_type(Base, lambda _: str, local_state)
+
+        with patch('typish._state.getmro', wraps=getmro) as spy:
+            self.assertEqual(str, get_type(Sub(), state=local_state))
+            self.assertEqual(str, get_type(Sub(), state=local_state))
+
+        self.assertEqual(1, spy.call_count)
+
+        # A registration clears the resolved types.
+        register_get_type(Sub, lambda _: int, local_state)
+        self.assertEqual(int, get_type(Sub(), state=local_state))
+
+    def test_state_with_resolved_types_can_be_pickled(self):
+        local_state = State()
+        register_get_type(int, str, local_state)
+        self.assertEqual(str, local_state.get_type_function(bool))
+
+        unpickled = pickle.loads(pickle.dumps(local_state))
+
+        self.assertEqual(str, unpickled.get_type_function(bool))
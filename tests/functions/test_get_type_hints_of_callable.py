@@ -1,5 +1,6 @@
-from typing import Callable
+from typing import Callable, get_type_hints
 from unittest import TestCase
+from unittest.mock import patch
 
 from typish import get_type_hints_of_callable, get_args_and_return_type
 
@@ -16,6 +17,23 @@ class TestGetTypeHintsOfCallable(TestCase):
         self.assertEqual(int, hints['y'])
         self.assertEqual(str, hints['return'])
 
+    def test_get_type_hints_of_callable_is_evaluated_once(self):
+
+        def func(x: 'int') -> 'str':
+            return str(x)
+
+        with patch('typing.get_type_hints',
+                   side_effect=get_type_hints) as get_type_hints_mock:
+            hints1 = get_type_hints_of_callable(func)
+            hints1['x'] = float
+            hints2 = get_type_hints_of_callable(func)
+            func.__annotations__['x'] = 'bytes'
+            hints3 = get_type_hints_of_callable(func)
+
+        self.assertEqual(2, get_type_hints_mock.call_count)
+        self.assertEqual(int, hints2['x'])
+        self.assertEqual(bytes, hints3['x'])
+
     def test_get_type_hints_of_empty_callable(self):
 
         def func():
@@ -67,7 +67,9 @@ class TestInstanceOf(TestCase):
             pass
 
         self.assertTrue(instance_of(func1, Callable[[int, str], object]))
-        self.assertTrue(instance_of(func1, Callable[[object, str], object]))
+        # Parameters are contravariant: func1 does not accept any object.
+        self.assertTrue(not instance_of(func1, Callable[[object, str], object]))
+        self.assertTrue(instance_of(func1, Callable[[bool, str], object]))
         self.assertTrue(not instance_of(func1, Callable[[str, str], object]))
         self.assertTrue(not instance_of(func1, Callable[[str, str], int]))
         self.assertTrue(instance_of(func2, Callable[[], int]))
@@ -101,6 +103,23 @@ class TestInstanceOf(TestCase):
         self.assertTrue(instance_of([1, 2, 3], Iterable[int]))
         self.assertTrue(instance_of((1, 2, 3), Iterable[int]))
 
+    def test_instance_of_nested_list_with_union(self):
+        self.assertTrue(instance_of([[1, '2'], [3]], List[List[Union[int, str]]]))
+        self.assertTrue(not instance_of([[1, '2'], [3.0]], List[List[Union[int, str]]]))
+
+    def test_instance_of_stops_at_first_mismatch(self):
+        checked = []
+
+        class CountingMeta(type):
+            def __instancecheck__(self, instance):
+                checked.append(instance)
+                return type(instance) is int
+
+        class Counting(metaclass=CountingMeta): pass
+
+        self.assertTrue(not instance_of(['1'] + [1] * 1000, List[Counting]))
+        self.assertEqual(['1'], checked)
+
     def test_instance_of_literal(self):
         self.assertTrue(instance_of(42, Literal[42]))
         self.assertTrue(instance_of(42, Literal[42], int))
@@ -0,0 +1,119 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Union, Optional
+from unittest import TestCase
+from unittest.mock import patch
+
+from typish import (
+    Literal,
+    Something,
+    State,
+    instance_of_many,
+    instance_of_many_failures,
+    instance_of_many_parallel,
+    register_get_type,
+)
+
+
+class Duck:
+    def __init__(self, name: Optional[str]):
+        self.name = name
+
+
+DuckType = Something['name': str]
+
+
+class TestInstanceOfMany(TestCase):
+    def test_instance_of_many(self):
+        records = [{'a': 1}, {'a': '1'}, {'a': 1.0}, {1: 1}, {}]
+        hint = Dict[str, Union[int, str]]
+
+        self.assertEqual([True, True, False, False, True],
+                         instance_of_many(records, hint))
+
+    def test_instance_of_many_with_multiple_types(self):
+        self.assertEqual([True, False, False],
+                         instance_of_many([42, 43, '42'], int, Literal[42]))
+
+    def test_instance_of_many_with_generator(self):
+        records = ([i] if i % 3 else ['x'] for i in range(6))
+
+        self.assertEqual([False, True, True, False, True, True],
+                         instance_of_many(records, List[int]))
+
+    def test_instance_of_many_empty(self):
+        self.assertEqual([], instance_of_many([], int))
+        self.assertEqual([], instance_of_many_failures([], int))
+
+    def test_instance_of_many_failures(self):
+        records = (i if i % 4 else str(i) for i in range(10))
+
+        self.assertEqual([0, 4, 8], instance_of_many_failures(records, int))
+
+    def test_instance_of_many_with_state(self):
+        class Wrapper:
+            pass
+
+        local_state = State()
+        register_get_type(Wrapper, lambda _: int, local_state)
+
+        self.assertEqual([True, True], instance_of_many([1, Wrapper()], int, state=local_state))
+        self.assertEqual([1], instance_of_many_failures([1, Wrapper()], int))
+
+    def test_instance_of_many_parallel(self):
+        records = [{'a': i} if i % 7 else {'a': str(i)} for i in range(100)]
+        records[42] = {'a': 4.2}
+        hint = Dict[str, Union[int, Literal['0', '7', '14']]]
+
+        expected = instance_of_many(records, hint)
+        actual = instance_of_many_parallel(records, hint, max_workers=2, chunk_size=10)
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(88, actual.count(True))
+
+    def test_instance_of_many_parallel_with_something(self):
+        ducks = (Duck('duck {}'.format(i) if i % 2 else None) for i in range(30))
+
+        actual = instance_of_many_parallel(ducks, DuckType, max_workers=2, chunk_size=7)
+
+        self.assertEqual([bool(i % 2) for i in range(30)], actual)
+
+    def test_instance_of_many_parallel_with_executor(self):
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            actual = instance_of_many_parallel(
+                range(-50, 50), Literal[tuple(range(10))], executor=executor, chunk_size=3)
+
+        self.assertEqual([0 <= i < 10 for i in range(-50, 50)], actual)
+
+    def test_instance_of_many_parallel_small_input_is_serial(self):
+        class NotPicklable:
+            pass
+
+        # A local class cannot be pickled, so this would fail if it went
+        # to a process pool.
+        self.assertEqual([True, False], instance_of_many_parallel([NotPicklable(), 1], NotPicklable))
+        self.assertEqual([], instance_of_many_parallel([], int))
+
+    def test_instance_of_many_parallel_with_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            instance_of_many_parallel([1, 2, 3], int, chunk_size=0)
+
+    def test_instance_of_many_parallel_with_threads_does_not_pickle(self):
+        class NotPicklable:
+            pass
+
+        objs = [NotPicklable() if i % 3 else i for i in range(20)]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            actual = instance_of_many_parallel(objs, NotPicklable, executor=executor, chunk_size=3)
+
+        self.assertEqual([bool(i % 3) for i in range(20)], actual)
+
+    def test_instance_of_many_parallel_without_worker_initializer(self):
+        # Before Python 3.7, a process pool cannot initialize its workers, so
+        # the types are sent with every chunk.
+        with patch('typish.functions._instance_of_many.sys') as sys_mock:
+            sys_mock.version_info = (3, 6)
+            actual = instance_of_many_parallel(range(-10, 10), Literal[tuple(range(5))],
+                                               max_workers=2, chunk_size=4)
+
+        self.assertEqual([0 <= i < 5 for i in range(-10, 10)], actual)
@@ -1,4 +1,5 @@
 import sys
+from abc import ABC
 from typing import List, Tuple, Union, Optional, Iterable, Any
 from unittest import TestCase
 
@@ -91,3 +92,42 @@ class TestSubclassOf(TestCase):
         self.assertTrue(subclass_of(Any, Literal[Any]))
         self.assertTrue(not subclass_of(int, Literal[Any]))
         self.assertTrue(not subclass_of(int, Literal))
+
+    def test_subclass_of_cache(self):
+        subclass_of.cache_clear()
+        self.assertTrue(subclass_of(List[E], List[A]))
+        misses = subclass_of.cache_info().misses
+        self.assertTrue(subclass_of(List[E], List[A]))
+        self.assertEqual(misses, subclass_of.cache_info().misses)
+        self.assertTrue(subclass_of.cache_info().hits > 0)
+
+        subclass_of.cache_clear()
+        self.assertEqual(0, subclass_of.cache_info().currsize)
+
+    def test_subclass_of_cache_size(self):
+        try:
+            subclass_of.set_cache_size(2)
+            subclass_of(A, B)
+            subclass_of(B, C)
+            subclass_of(C, D)
+            self.assertEqual(2, subclass_of.cache_info().currsize)
+            self.assertEqual(2, subclass_of.cache_info().maxsize)
+        finally:
+            subclass_of.set_cache_size(4096)
+
+    def test_subclass_of_cache_with_abc_registration(self):
+        class SomeABC(ABC): pass
+
+        class SomeClass: pass
+
+        self.assertTrue(not subclass_of(SomeClass, SomeABC))
+        SomeABC.register(SomeClass)
+        self.assertTrue(subclass_of(SomeClass, SomeABC))
+
+    def test_subclass_of_unhashable(self):
+        class Unhashable(type):
+            __hash__ = None
+
+        class SomeClass(metaclass=Unhashable): pass
+
+        self.assertTrue(subclass_of(SomeClass, object))
@@ -0,0 +1,95 @@
+import gc
+import inspect
+import weakref
+from functools import partial
+from types import MethodType
+from unittest import TestCase
+from unittest.mock import Mock
+
+from typish._callable_cache import cached_per_callable, is_lambda
+
+
+class TestCallableCache(TestCase):
+    def test_cached_per_callable(self):
+        derive = Mock(side_effect=lambda func: func.__annotations__.get('x'))
+        cached = cached_per_callable(derive)
+
+        def func(x: int):
+            ...
+
+        self.assertEqual(int, cached(func))
+        self.assertEqual(int, cached(func))
+        self.assertEqual(1, derive.call_count)
+
+    def test_cached_per_callable_is_invalidated(self):
+        cached = cached_per_callable(
+            lambda func: func.__annotations__.get('x'))
+
+        def func(x: int):
+            ...
+
+        self.assertEqual(int, cached(func))
+        func.__annotations__['x'] = str
+        self.assertEqual(str, cached(func))
+        func.__annotations__ = {'x': float}
+        self.assertEqual(float, cached(func))
+        func.__signature__ = None
+        func.__annotations__ = {'x': bytes}
+        self.assertEqual(bytes, cached(func))
+
+    def test_cached_per_callable_distinguishes_bound_methods(self):
+        cached = cached_per_callable(
+            lambda func: list(inspect.signature(func).parameters))
+
+        class C:
+            def method(self, x):
+                ...
+
+        self.assertEqual(['self', 'x'], cached(C.method))
+        self.assertEqual(['x'], cached(C().method))
+        self.assertEqual(['x'], cached(C().method))
+
+    def test_cached_per_callable_with_methods_of_other_callables(self):
+        derive = Mock(side_effect=lambda func: inspect.signature(func))
+        cached = cached_per_callable(derive)
+
+        def func(x: int, y: str):
+            ...
+
+        partial_method = MethodType(partial(func), 42)
+        builtin_method = MethodType(len, [])
+
+        self.assertEqual(inspect.signature(partial_method), cached(partial_method))
+        self.assertEqual(inspect.signature(partial_method), cached(partial_method))
+        self.assertEqual(inspect.signature(builtin_method), cached(builtin_method))
+        self.assertEqual(3, derive.call_count)
+
+    def test_cached_per_callable_does_not_keep_functions_alive(self):
+        cached = cached_per_callable(lambda func: func.__name__)
+
+        def func():
+            ...
+
+        cached(func)
+        func_ref = weakref.ref(func)
+        del func
+        gc.collect()
+
+        self.assertIsNone(func_ref())
+
+    def test_cached_per_callable_without_functions(self):
+        derive = Mock(return_value=42)
+        cached = cached_per_callable(derive)
+
+        cached(print)
+        cached(print)
+
+        self.assertEqual(2, derive.call_count)
+
+    def test_is_lambda(self):
+        def lambda_handler():
+            ...
+
+        self.assertTrue(is_lambda(lambda: 42))
+        self.assertFalse(is_lambda(lambda_handler))
+        self.assertFalse(is_lambda(print))
@@ -0,0 +1,59 @@
+import gc
+from typing import Dict, List, Union
+from unittest import TestCase
+from unittest.mock import patch
+
+from typish import Something
+from typish._capabilities import _capabilities_per_id, get_capabilities
+
+
+class TestCapabilities(TestCase):
+    def test_get_capabilities(self):
+        list_capabilities = get_capabilities(List[int])
+        something_capabilities = get_capabilities(Something['x': int])
+        int_capabilities = get_capabilities(int)
+
+        self.assertTrue(list_capabilities.is_from_typing)
+        self.assertEqual(list, list_capabilities.origin)
+        self.assertEqual((int,), list_capabilities.args)
+        self.assertTrue(something_capabilities.has_instancecheck)
+        self.assertTrue(something_capabilities.has_subclasscheck)
+        self.assertFalse(something_capabilities.is_from_typing)
+        self.assertFalse(int_capabilities.has_instancecheck)
+        self.assertFalse(int_capabilities.is_from_typing)
+        self.assertEqual(int, int_capabilities.origin)
+        self.assertEqual((), int_capabilities.args)
+
+    def test_get_capabilities_is_computed_once(self):
+        hint = Dict[str, bytes]
+        with patch('typish._capabilities.dir', create=True,
+                   side_effect=dir) as dir_mock:
+            get_capabilities(hint)
+            get_capabilities(hint)
+
+        self.assertEqual(1, dir_mock.call_count)
+
+    def test_get_capabilities_distinguishes_equal_hints(self):
+        # Equal hints may have their args in a different order.
+        capabilities1 = get_capabilities(Union[int, str])
+        capabilities2 = get_capabilities(Union[str, int])
+
+        self.assertEqual((int, str), capabilities1.args)
+        self.assertEqual((str, int), capabilities2.args)
+
+    def test_get_capabilities_does_not_keep_hints_alive(self):
+        cls = type('SomeClass', (), {})
+        key = id(cls)
+        get_capabilities(cls)
+        self.assertIn(key, _capabilities_per_id)
+
+        del cls
+        gc.collect()
+
+        self.assertNotIn(key, _capabilities_per_id)
+
+    def test_get_capabilities_without_weak_references(self):
+        capabilities = get_capabilities('not a type')
+
+        self.assertFalse(capabilities.is_from_typing)
+        self.assertEqual('not a type', capabilities.origin)
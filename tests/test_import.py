@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+import typish
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code: str) -> str:
+    return subprocess.check_output([sys.executable, '-c', code], cwd=_ROOT).decode()
+
+
+class TestImport(TestCase):
+    def test_import_is_lazy(self):
+        # Test that importing typish does not import any of its subsystems.
+        output = _run('import sys, typish; '
+                      'print(sorted(m for m in sys.modules if m.startswith("typish")))')
+
+        self.assertEqual("['typish', 'typish._meta']", output.strip())
+
+    def test_import_does_not_load_heavy_modules(self):
+        # Test that importing typish stays cheap: the modules that make up most
+        # of the import time are loaded when they are first needed.
+        heavy = ['typing', 'inspect', 'ast', 'dis', 'pickle', 'concurrent.futures']
+        output = _run('import sys, typish; heavy = {}; '
+                      'print([m for m in heavy if m in sys.modules]); '
+                      'typish.hintable; typish.instance_of_many_parallel; '
+                      'print([m for m in heavy if m in sys.modules])'.format(heavy))
+
+        before, after = output.splitlines()
+        self.assertEqual('[]', before)
+        self.assertEqual(str(heavy), after)
+
+    def test_attributes_are_loaded_on_first_use(self):
+        output = _run('import sys, typish; typish.instance_of; '
+                      'print("typish.functions._instance_of" in sys.modules, '
+                      '"typish.decorators._hintable" in sys.modules)')
+
+        self.assertEqual('True False', output.strip())
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            typish.does_not_exist
+
+    def test_all_is_complete(self):
+        for name in typish.__all__:
+            self.assertTrue(hasattr(typish, name), name)
+        self.assertIn('instance_of', dir(typish))
@@ -1,39 +1,82 @@
+import sys
+from importlib import import_module
+
 from typish._meta import __version__
-from typish._types import (
-    T,
-    KT,
-    VT,
-    Empty,
-    Unknown,
-    Module,
-    NoneType,
-    Ellipsis_,
-    EllipsisType,
-)
-from typish.classes._cls_dict import ClsDict
-from typish.classes._cls_function import ClsFunction
-from typish.classes._literal import Literal, LiteralAlias, is_literal_type
-from typish.classes._something import Something, TypingType
-from typish.classes._subscriptable_type import SubscriptableType
-from typish.classes._union_type import UnionType
-from typish.decorators._hintable import hintable
-from typish.functions._common_ancestor import (
-    common_ancestor,
-    common_ancestor_of_types
-)
-from typish.functions._get_alias import get_alias
-from typish.functions._get_args import get_args
-from typish.functions._get_mro import get_mro
-from typish.functions._get_origin import get_origin
-from typish.functions._get_simple_name import get_simple_name
-from typish.functions._get_type import get_type
-from typish.functions._get_type_hints_of_callable import (
-    get_args_and_return_type,
-    get_type_hints_of_callable
-)
-from typish.functions._instance_of import instance_of
-from typish.functions._is_type_annotation import is_type_annotation
-from typish.functions._is_optional_type import is_optional_type
-from typish.functions._subclass_of import subclass_of
-from typish.functions._is_from_typing import is_from_typing
-from typish._state import State, register_get_type
+
+# The public names of typish and the modules that define them. These modules
+# are imported upon first use of any of their names (PEP 562).
+_module_per_name = {
+    'T': 'typish._types',
+    'KT': 'typish._types',
+    'VT': 'typish._types',
+    'Empty': 'typish._types',
+    'Unknown': 'typish._types',
+    'Module': 'typish._types',
+    'NoneType': 'typish._types',
+    'Ellipsis_': 'typish._types',
+    'EllipsisType': 'typish._types',
+    'Checker': 'typish.classes._checker',
+    'CheckFailure': 'typish.classes._checker',
+    'ClsDict': 'typish.classes._cls_dict',
+    'ClsFunction': 'typish.classes._cls_function',
+    'Literal': 'typish.classes._literal',
+    'LiteralAlias': 'typish.classes._literal',
+    'is_literal_type': 'typish.classes._literal',
+    'Something': 'typish.classes._something',
+    'TypingType': 'typish.classes._something',
+    'SubscriptableType': 'typish.classes._subscriptable_type',
+    'UnionType': 'typish.classes._union_type',
+    'ValidatedDict': 'typish.classes._validated',
+    'ValidatedList': 'typish.classes._validated',
+    'hintable': 'typish.decorators._hintable',
+    'check': 'typish.functions._check',
+    'common_ancestor': 'typish.functions._common_ancestor',
+    'common_ancestor_of_types': 'typish.functions._common_ancestor',
+    'compile': 'typish.functions._compile',
+    'get_alias': 'typish.functions._get_alias',
+    'get_args': 'typish.functions._get_args',
+    'get_mro': 'typish.functions._get_mro',
+    'get_origin': 'typish.functions._get_origin',
+    'get_simple_name': 'typish.functions._get_simple_name',
+    'get_sampled_type': 'typish.functions._get_type',
+    'get_type': 'typish.functions._get_type',
+    'get_args_and_return_type': 'typish.functions._get_type_hints_of_callable',
+    'get_type_hints_of_callable': 'typish.functions._get_type_hints_of_callable',
+    'instance_of': 'typish.functions._instance_of',
+    'instance_of_many': 'typish.functions._instance_of_many',
+    'instance_of_many_failures': 'typish.functions._instance_of_many',
+    'instance_of_many_parallel': 'typish.functions._instance_of_many',
+    'is_type_annotation': 'typish.functions._is_type_annotation',
+    'is_optional_type': 'typish.functions._is_optional_type',
+    'subclass_of': 'typish.functions._subclass_of',
+    'is_from_typing': 'typish.functions._is_from_typing',
+    'State': 'typish._state',
+    'register_get_type': 'typish._state',
+}
+
+__all__ = ['__version__', *_module_per_name]
+
+
+def __getattr__(name: str):
+    """
+    Import the public attribute with the given name upon first use.
+    :param name: the name of the attribute.
+    :return: the attribute.
+    """
+    module_name = _module_per_name.get(name)
+    if not module_name:
+        raise AttributeError('module {} has no attribute {}'
+                             .format(__name__, name))
+    attr = getattr(import_module(module_name), name)
+    globals()[name] = attr  # Subsequent lookups won't pass __getattr__.
+    return attr
+
+
+def __dir__():
+    return sorted(__all__)
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # Module level __getattr__ is not supported before Python 3.7 (PEP 562).
+    for _name in _module_per_name:
+        __getattr__(_name)
@@ -0,0 +1,58 @@
+import types
+import typing
+from functools import wraps
+from weakref import WeakKeyDictionary
+
+# The callables of which results are cached.
+_CACHED_TYPES = (types.FunctionType, types.MethodType)
+
+
+def cached_per_callable(
+        derive: typing.Callable[[typing.Callable], typing.Any]) \
+        -> typing.Callable[[typing.Callable], typing.Any]:
+    """
+    Decorate a function that derives something from the signature of a
+    callable (e.g. its type hints), so that its result is cached per function
+    for as long as that function lives. A result is derived again once the
+    code, ``__annotations__`` or ``__signature__`` of the function change.
+
+    Bound methods are cached per function, apart from the function itself, so
+    ``derive`` must not depend on the instance that a method is bound to; the
+    signature of a bound method does not. Callables other than functions and
+    methods of functions (e.g. builtins and partials) are not cached.
+    :param derive: the function that takes a callable.
+    :return: a caching wrapper around ``derive``.
+    """
+    cache = WeakKeyDictionary()
+
+    @wraps(derive)
+    def _wrapper(func: typing.Callable) -> typing.Any:
+        function = getattr(func, '__func__', func)
+        if (not isinstance(func, _CACHED_TYPES)
+                or not isinstance(function, types.FunctionType)):
+            return derive(func)
+        is_method = function is not func
+        code = function.__code__
+        signature = getattr(function, '__signature__', None)
+        annotations = function.__annotations__
+        entries = cache.get(function)
+        entry = entries and entries.get(is_method)
+        if (entry and entry[0] is code and entry[1] is signature
+                and entry[2] == annotations):
+            return entry[3]
+        result = derive(func)
+        entries = cache.setdefault(function, {})
+        entries[is_method] = code, signature, dict(annotations), result
+        return result
+
+    return _wrapper
+
+
+def is_lambda(func: typing.Callable) -> bool:
+    """
+    Return whether the given callable is (bound to) a lambda function.
+    :param func: the callable in subject.
+    :return: True if ``func`` is a lambda.
+    """
+    code = getattr(func, '__code__', None)
+    return getattr(code, 'co_name', None) == '<lambda>'
@@ -0,0 +1,88 @@
+import typing
+from weakref import ref
+
+from typish.classes._literal import LiteralValues
+from typish.functions._get_args import get_args
+from typish.functions._get_origin import get_origin
+from typish.functions._is_from_typing import is_from_typing
+
+# Marks an attribute of Capabilities that has not been computed yet.
+_NOT_SET = object()
+
+
+class Capabilities:
+    """
+    The properties of a type hint that typish needs to decide how to check
+    against that hint. These are computed once per hint by
+    ``get_capabilities``. The origin, args and literal values are only
+    computed upon first access, since not every hint has meaningful ones.
+    """
+    __slots__ = ('has_instancecheck', 'has_subclasscheck', 'is_from_typing',
+                 '_get_hint', '_origin', '_args', '_literal_values')
+
+    def __init__(
+            self,
+            hint: typing.Any,
+            get_hint: typing.Callable[[], typing.Any]) -> None:
+        """
+        Constructor.
+        :param hint: the type hint of which the capabilities are determined.
+        :param get_hint: a callable that returns the hint when needed later.
+        """
+        attrs = dir(hint)
+        self.has_instancecheck = '__instancecheck__' in attrs
+        self.has_subclasscheck = '__subclasscheck__' in attrs
+        self.is_from_typing = (hasattr(hint, '__module__')
+                               and is_from_typing(hint))
+        self._get_hint = get_hint
+        self._origin = _NOT_SET
+        self._args = _NOT_SET
+        self._literal_values = _NOT_SET
+
+    @property
+    def origin(self) -> typing.Any:
+        if self._origin is _NOT_SET:
+            self._origin = get_origin(self._get_hint())
+        return self._origin
+
+    @property
+    def args(self) -> typing.Tuple[typing.Any, ...]:
+        if self._args is _NOT_SET:
+            self._args = get_args(self._get_hint())
+        return self._args
+
+    @property
+    def literal_values(self) -> LiteralValues:
+        # The args of the hint as values of a Literal.
+        if self._literal_values is _NOT_SET:
+            self._literal_values = LiteralValues(self.args)
+        return self._literal_values
+
+
+def get_capabilities(hint: typing.Any) -> Capabilities:
+    """
+    Return the capabilities of the given hint. These are cached per hint
+    object for as long as that object lives. Hints that cannot be weakly
+    referenced are analyzed on every call.
+    :param hint: the type hint in subject.
+    :return: the capabilities of ``hint``.
+    """
+    key = id(hint)
+    entry = _capabilities_per_id.get(key)
+    if entry and entry[0]() is hint:
+        return entry[1]
+    try:
+        hint_ref = ref(hint, lambda _: _capabilities_per_id.pop(key, None))
+    except TypeError:
+        # hint does not support weak references and is not cached.
+        return Capabilities(hint, lambda: hint)
+    capabilities = Capabilities(hint, hint_ref)
+    _capabilities_per_id[key] = (hint_ref, capabilities)
+    return capabilities
+
+
+# The capabilities of hints by their id. The entries are keyed by identity
+# rather than by equality, because equal hints (e.g. Union[int, str] and
+# Union[str, int]) may still differ in their args. Each entry holds a weak
+# reference that removes the entry once its hint is collected.
+_capabilities_per_id = {}
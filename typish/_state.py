@@ -1,6 +1,8 @@
-from typing import Callable
+from inspect import getmro
+from typing import Any, Callable, Dict, Optional
+from weakref import WeakKeyDictionary
 
-from typish import T
+from typish._types import T
 
 
 class State:
@@ -12,6 +14,7 @@ class State:
         Constructor.
         """
         self.get_type_per_cls = {}
+        self._get_type_function_per_cls = WeakKeyDictionary()
 
     def register_get_type(
             self,
@@ -19,12 +22,53 @@ class State:
             get_type_function: Callable[[T], type]) -> None:
         """
         Register a callable for some type that is to be used when calling
-        typish.get_type.
+        typish.get_type. It is used for subclasses of that type as well,
+        unless a callable is registered for a closer super type.
         :param cls: the type for which that given callable is to be called.
         :param get_type_function: the callable to call for that type.
         :return: None.
         """
         self.get_type_per_cls[cls] = get_type_function
+        self._get_type_function_per_cls.clear()
+
+    def get_type_function(self, cls: type) -> Optional[Callable[[T], type]]:
+        """
+        Return the callable that was registered for the given type or else
+        for its closest super type. The result is cached per type until a
+        callable is registered.
+        :param cls: the type in subject.
+        :return: the registered callable or None if there is none.
+        """
+        if not self.get_type_per_cls:
+            return None
+        try:
+            return self._get_type_function_per_cls[cls]
+        except KeyError:
+            result = self._resolve_get_type_function(cls)
+            self._get_type_function_per_cls[cls] = result
+            return result
+        except TypeError:
+            # An unhashable class; it cannot be cached.
+            return self._resolve_get_type_function(cls)
+
+    def _resolve_get_type_function(
+            self,
+            cls: type) -> Optional[Callable[[T], type]]:
+        # Return the first callable that was registered for a type in the mro
+        # of cls.
+        for super_cls in getmro(cls):
+            get_type_function = self.get_type_per_cls.get(super_cls)
+            if get_type_function:
+                return get_type_function
+        return None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The cache cannot be pickled and is rebuilt upon use.
+        return {'get_type_per_cls': self.get_type_per_cls}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._get_type_function_per_cls = WeakKeyDictionary()
 
 
 DEFAULT = State()
@@ -36,7 +80,8 @@ def register_get_type(
         state: State = DEFAULT) -> None:
     """
     Register a callable for some type that is to be used when calling
-    typish.get_type.
+    typish.get_type. It is used for subclasses of that type as well, unless a
+    callable is registered for a closer super type.
     :param cls: the type for which that given callable is to be called.
     :param get_type_function: the callable to call for that type.
     :param state: any state that is used by typish.
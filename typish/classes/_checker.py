@@ -0,0 +1,404 @@
+import types
+import typing
+from collections import deque
+
+from typish._state import State
+from typish.classes._literal import LiteralValues
+from typish.functions._callable_compatibility import is_callable_compatible
+from typish.functions._get_type import get_type
+from typish.functions._subclass_of import subclass_of
+
+# The types of which instances are checked element-wise by an _IterableNode.
+# Other iterables (e.g. str or generators) are left to the generic check.
+_ITERABLE_TYPES = (list, tuple, set, frozenset, deque)
+
+# The types of which the signature is matched directly by a _CallableNode.
+_FUNCTION_TYPES = (types.FunctionType, types.MethodType)
+
+# The location of some element in an object as a sequence of keys/indices.
+_Path = typing.Tuple[typing.Any, ...]
+
+# The marker in a path that tells that a key failed rather than its value.
+_KEY = object()
+
+
+class CheckFailure:
+    """
+    A CheckFailure tells why an object is not an instance of a type hint. It is
+    reported by ``typish.check`` for some element of the checked object.
+    """
+    def __init__(self, path: str, expected: typing.Any, actual: type) -> None:
+        """
+        Constructor.
+        :param path: the JSONPath-like location of the failing element, e.g.
+        ``$.users[3].name``. A failing key of a mapping ends with a ``~``,
+        e.g. ``$.users[3]~``.
+        :param expected: the type hint that the element should satisfy.
+        :param actual: the type of the failing element.
+        """
+        self.path = path
+        self.expected = expected
+        self.actual = actual
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, CheckFailure)
+                and (self.path, self.expected, self.actual)
+                == (other.path, other.expected, other.actual))
+
+    def __repr__(self) -> str:
+        return 'CheckFailure(path={!r}, expected={}, actual={})'.format(
+            self.path, self.expected, self.actual)
+
+    def __str__(self) -> str:
+        return '{}: expected {}, got {}'.format(
+            self.path, self.expected, self.actual)
+
+
+class Checker:
+    """
+    A Checker is the compiled form of a type hint. It is created by
+    ``typish.compile`` and can be called with any object to check whether that
+    object is an instance of the hint. The hint is analyzed only once, at
+    creation, so calling a Checker only costs the walk over the object.
+    """
+    def __init__(self, hint: typing.Any, node: '_Node') -> None:
+        """
+        Constructor.
+        :param hint: the type hint that was compiled.
+        :param node: the root node of the compiled hint.
+        """
+        self.hint = hint
+        self._node = node
+
+    def __call__(self, obj: object) -> bool:
+        """
+        Check whether ``obj`` is an instance of the compiled hint.
+        :param obj: the object in subject.
+        :return: ``True`` if ``obj`` is an instance of the compiled hint.
+        """
+        return self._node(obj)
+
+    def check(
+            self,
+            obj: object,
+            limit: typing.Optional[int] = 1) -> typing.List[CheckFailure]:
+        """
+        Check whether ``obj`` is an instance of the compiled hint and report
+        why not. The check stops as soon as ``limit`` failures are found.
+        :param obj: the object in subject.
+        :param limit: the maximum number of failures to report or ``None`` to
+        report all failures.
+        :return: a list of failures, which is empty if ``obj`` is an instance
+        of the compiled hint.
+        """
+        if limit is not None and limit < 1:
+            raise ValueError('The limit must be at least 1, got {}.'
+                             .format(limit))
+        failures = []
+        self._node.explain(obj, (), failures, limit or float('inf'))
+        return failures
+
+    def __repr__(self) -> str:
+        return 'typish.Checker[{}]'.format(self.hint)
+
+
+class _Node:
+    """
+    A node in the tree of a compiled type hint. Each node knows how to check
+    one particular kind of hint and delegates to its children for any nested
+    hints.
+    """
+    def __init__(self, hint: typing.Any, state: State) -> None:
+        self.hint = hint
+        self.state = state
+
+    def __call__(self, obj: object) -> bool:
+        if self.state.get_type_function(type(obj)):
+            # A custom get_type was registered for obj; respect it.
+            return _generic_check(obj, self.hint, self.state)
+        return self._check(obj)
+
+    def _check(self, obj: object) -> bool:
+        raise NotImplementedError  # pragma: no cover
+
+    def explain(
+            self,
+            obj: object,
+            path: _Path,
+            failures: typing.List[CheckFailure],
+            limit: float) -> bool:
+        # Check obj like __call__ does, but add a CheckFailure to failures for
+        # each failing element, until there are limit failures. Nodes of
+        # containers override this to pinpoint the failing elements.
+        if not self.state.get_type_function(type(obj)):
+            explain_elements = self._explain_elements(obj)
+            if explain_elements:
+                return explain_elements(obj, path, failures, limit)
+        if self(obj):
+            return True
+        failures.append(CheckFailure(_format_path(path), self.hint, type(obj)))
+        return False
+
+    def _explain_elements(self, obj: object) -> typing.Optional[
+            typing.Callable[..., bool]]:
+        # Return a callable that explains the elements of obj (with the
+        # signature of explain), or None if obj is checked as a whole.
+        return None
+
+
+class _AnyNode(_Node):
+    # Everything is an instance of Any or object.
+    def __call__(self, obj: object) -> bool:
+        return True
+
+
+class _ClassNode(_Node):
+    # A plain (non-generic) class.
+    def __init__(self, hint: typing.Any, state: State, cls: type) -> None:
+        super().__init__(hint, state)
+        self.cls = cls
+
+    def _check(self, obj: object) -> bool:
+        return isinstance(obj, self.cls)
+
+
+class _InstanceCheckNode(_Node):
+    # A type with a custom __instancecheck__, such as Something.
+    def _check(self, obj: object) -> bool:
+        return isinstance(obj, self.hint)
+
+
+class _LiteralNode(_Node):
+    def __init__(
+            self,
+            hint: typing.Any,
+            state: State,
+            values: LiteralValues) -> None:
+        super().__init__(hint, state)
+        self.values = values
+
+    def _check(self, obj: object) -> bool:
+        return obj in self.values
+
+
+class _UnionNode(_Node):
+    def __init__(
+            self,
+            hint: typing.Any,
+            state: State,
+            options: typing.Sequence[_Node]) -> None:
+        super().__init__(hint, state)
+        self.options = tuple(options)
+
+    def _check(self, obj: object) -> bool:
+        return any(option(obj) for option in self.options)
+
+    def explain(
+            self,
+            obj: object,
+            path: _Path,
+            failures: typing.List[CheckFailure],
+            limit: float) -> bool:
+        if self(obj):
+            return True
+        # If only one option could contain obj (e.g. List[int] in
+        # Optional[List[int]]), then pinpoint the failing elements in there.
+        options = [option for option in self.options
+                   if option._explain_elements(obj)]
+        if (len(options) == 1
+                and not self.state.get_type_function(type(obj))):
+            return options[0].explain(obj, path, failures, limit)
+        failures.append(CheckFailure(_format_path(path), self.hint, type(obj)))
+        return False
+
+
+class _CallableNode(_Node):
+    def _check(self, obj: object) -> bool:
+        # Only callables need to have their signature inspected. Those of
+        # functions and methods are matched against the hint directly, which
+        # respects their defaults and keyword-only parameters.
+        if isinstance(obj, _FUNCTION_TYPES):
+            return is_callable_compatible(obj, self.hint)
+        return callable(obj) and _generic_check(obj, self.hint, self.state)
+
+
+class _IterableNode(_Node):
+    # A generic collection with one argument, such as List[int].
+    def __init__(
+            self,
+            hint: typing.Any,
+            state: State,
+            origin: type,
+            element: _Node) -> None:
+        super().__init__(hint, state)
+        self.origin = origin
+        self.element = element
+
+    def _check(self, obj: object) -> bool:
+        if isinstance(obj, _ITERABLE_TYPES) or isinstance(obj, dict):
+            return (isinstance(obj, self.origin)
+                    and all(self.element(elem) for elem in obj))
+        return _generic_check(obj, self.hint, self.state)
+
+    def _explain_elements(self, obj: object) -> typing.Optional[
+            typing.Callable[..., bool]]:
+        if ((isinstance(obj, _ITERABLE_TYPES) or isinstance(obj, dict))
+                and isinstance(obj, self.origin)):
+            return self._explain_iterable
+        return None
+
+    def _explain_iterable(
+            self,
+            obj: typing.Iterable,
+            path: _Path,
+            failures: typing.List[CheckFailure],
+            limit: float) -> bool:
+        return _explain_all(((path + (index,), self.element, elem)
+                             for index, elem in enumerate(obj)),
+                            failures, limit)
+
+
+class _MappingNode(_Node):
+    # A generic mapping, such as Dict[str, int].
+    def __init__(
+            self,
+            hint: typing.Any,
+            state: State,
+            origin: type,
+            key: _Node,
+            value: _Node) -> None:
+        super().__init__(hint, state)
+        self.origin = origin
+        self.key = key
+        self.value = value
+
+    def _check(self, obj: object) -> bool:
+        if isinstance(obj, dict):
+            return (isinstance(obj, self.origin)
+                    and all(self.key(key) and self.value(value)
+                            for key, value in obj.items()))
+        if isinstance(obj, _ITERABLE_TYPES):
+            # These can never be instances of a generic mapping.
+            return False
+        return _generic_check(obj, self.hint, self.state)
+
+    def _explain_elements(self, obj: object) -> typing.Optional[
+            typing.Callable[..., bool]]:
+        if isinstance(obj, dict) and isinstance(obj, self.origin):
+            return self._explain_mapping
+        return None
+
+    def _explain_mapping(
+            self,
+            obj: typing.Mapping,
+            path: _Path,
+            failures: typing.List[CheckFailure],
+            limit: float) -> bool:
+        # A failing key is reported at the path of its entry, marked as key.
+        def _checks() -> typing.Iterable[typing.Tuple[_Path, _Node, object]]:
+            for key, value in obj.items():
+                yield path + (key, _KEY), self.key, key
+                yield path + (key,), self.value, value
+
+        return _explain_all(_checks(), failures, limit)
+
+
+class _TupleNode(_Node):
+    # A tuple with a fixed number of arguments, such as Tuple[int, str].
+    def __init__(
+            self,
+            hint: typing.Any,
+            state: State,
+            elements: typing.Sequence[_Node]) -> None:
+        super().__init__(hint, state)
+        self.elements = tuple(elements)
+
+    def _check(self, obj: object) -> bool:
+        return (isinstance(obj, tuple)
+                and len(obj) == len(self.elements)
+                and all(element(elem)
+                        for element, elem in zip(self.elements, obj)))
+
+    def _explain_elements(self, obj: object) -> typing.Optional[
+            typing.Callable[..., bool]]:
+        if isinstance(obj, tuple) and len(obj) == len(self.elements):
+            return self._explain_tuple
+        return None
+
+    def _explain_tuple(
+            self,
+            obj: tuple,
+            path: _Path,
+            failures: typing.List[CheckFailure],
+            limit: float) -> bool:
+        return _explain_all(((path + (index,), element, elem)
+                             for index, (element, elem)
+                             in enumerate(zip(self.elements, obj))),
+                            failures, limit)
+
+
+class _VariadicTupleNode(_Node):
+    # A tuple with any number of arguments, such as Tuple[int, ...].
+    def __init__(self, hint: typing.Any, state: State, element: _Node) -> None:
+        super().__init__(hint, state)
+        self.element = element
+
+    def _check(self, obj: object) -> bool:
+        return (isinstance(obj, tuple)
+                and all(self.element(elem) for elem in obj))
+
+    def _explain_elements(self, obj: object) -> typing.Optional[
+            typing.Callable[..., bool]]:
+        return self._explain_tuple if isinstance(obj, tuple) else None
+
+    def _explain_tuple(
+            self,
+            obj: tuple,
+            path: _Path,
+            failures: typing.List[CheckFailure],
+            limit: float) -> bool:
+        return _explain_all(((path + (index,), self.element, elem)
+                             for index, elem in enumerate(obj)),
+                            failures, limit)
+
+
+class _GenericNode(_Node):
+    # Any hint that has no specialized node.
+    def _check(self, obj: object) -> bool:
+        return _generic_check(obj, self.hint, self.state)
+
+
+def _explain_all(
+        checks: typing.Iterable[typing.Tuple[_Path, _Node, object]],
+        failures: typing.List[CheckFailure],
+        limit: float) -> bool:
+    # Explain each (path, node, obj) in checks, until there are limit
+    # failures. Return whether all passed.
+    result = True
+    for path, node, obj in checks:
+        if not node.explain(obj, path, failures, limit):
+            result = False
+            if len(failures) >= limit:
+                break
+    return result
+
+
+def _format_path(path: _Path) -> str:
+    # Format path like JSONPath, e.g. ('users', 3, 'name') as $.users[3].name.
+    # The key of an entry is marked with a '~' (as in JSONPath-Plus), e.g.
+    # (3, _KEY) as $[3]~.
+    parts = ['$']
+    for key in path:
+        if key is _KEY:
+            parts.append('~')
+        elif isinstance(key, str) and key.isidentifier():
+            parts.append('.' + key)
+        else:
+            parts.append('[{!r}]'.format(key))
+    return ''.join(parts)
+
+
+def _generic_check(obj: object, hint: typing.Any, state: State) -> bool:
+    # Check obj against hint by inferring the type of obj first.
+    type_ = get_type(obj, use_union=True, state=state)
+    return subclass_of(type_, hint)
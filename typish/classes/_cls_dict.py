@@ -1,5 +1,11 @@
 from collections import OrderedDict
-from typing import Optional, Any
+from typing import Optional, Any, Dict, List, Tuple
+
+from typish._capabilities import get_capabilities
+from typish._state import DEFAULT
+from typish.functions._get_type import get_type
+from typish.functions._is_type_annotation import is_type_annotation
+from typish.functions._subclass_of import subclass_of
 
 
 class ClsDict(OrderedDict):
@@ -14,8 +20,6 @@ class ClsDict(OrderedDict):
         :param kwargs: any kwargs that ``dict`` accepts.
         :return: a ``ClsDict``.
         """
-        from typish.functions._is_type_annotation import is_type_annotation
-
         if len(args) > 1:
             raise TypeError('TypeDict accepts only one positional argument, '
                             'which must be a dict.')
@@ -33,17 +37,101 @@ class ClsDict(OrderedDict):
         :param item: any item.
         :return: the value of which the type corresponds with item.
         """
-        from typish.functions._get_type import get_type
-        from typish.functions._subclass_of import subclass_of
+        entries, generic_positions, index = self._get_dispatch_index()
+        item_cls = type(item)
+        item_type = None
+        if (item_cls in index
+                and not DEFAULT.get_type_function(item_cls)):
+            # Only the generic keys before the indexed key remain to be checked.
+            position = index[item_cls]
+            for generic_position in generic_positions:
+                if position is not None and generic_position > position:
+                    break
+                key, value, _ = entries[generic_position]
+                if item_type is None:
+                    item_type = get_type(item, use_union=True)
+                if subclass_of(item_type, key):
+                    return value
+            if position is None:
+                raise KeyError('No match for {}'.format(item))
+            return entries[position][1]
 
-        item_type = get_type(item, use_union=True)
-        for key, value in self.items():
+        for position, (key, value, is_plain) in enumerate(entries):
+            if item_type is None:
+                item_type = get_type(item, use_union=True)
             if subclass_of(item_type, key):
+                if is_plain:
+                    index[item_cls] = position
                 return value
+        index[item_cls] = None
         raise KeyError('No match for {}'.format(item))
 
+    def _get_dispatch_index(self) -> Tuple[List[Tuple[Any, Any, bool]],
+                                           List[int],
+                                           Dict[type, Optional[int]]]:
+        # Return the entries of this ClsDict, the positions of its generic keys
+        # and the index that maps runtime types to the position of the first
+        # plain key that matches.
+        dispatch_index = self.__dict__.get('_dispatch_index')
+        if dispatch_index is None:
+            entries = [(key, value, _is_plain_key(key))
+                       for key, value in self.items()]
+            generic_positions = [position for position, (_, _, is_plain)
+                                 in enumerate(entries) if not is_plain]
+            dispatch_index = entries, generic_positions, {}
+            self.__dict__['_dispatch_index'] = dispatch_index
+        return dispatch_index
+
+    def _invalidate_dispatch_index(self) -> None:
+        self.__dict__.pop('_dispatch_index', None)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._invalidate_dispatch_index()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        self._invalidate_dispatch_index()
+        super().__delitem__(key)
+
+    def clear(self) -> None:
+        self._invalidate_dispatch_index()
+        super().clear()
+
+    def pop(self, *args, **kwargs) -> Any:
+        self._invalidate_dispatch_index()
+        return super().pop(*args, **kwargs)
+
+    def popitem(self, *args, **kwargs) -> Tuple[Any, Any]:
+        self._invalidate_dispatch_index()
+        return super().popitem(*args, **kwargs)
+
+    def setdefault(self, *args, **kwargs) -> Any:
+        self._invalidate_dispatch_index()
+        return super().setdefault(*args, **kwargs)
+
+    def update(self, *args, **kwargs) -> None:
+        self._invalidate_dispatch_index()
+        super().update(*args, **kwargs)
+
+    def move_to_end(self, *args, **kwargs) -> None:
+        self._invalidate_dispatch_index()
+        super().move_to_end(*args, **kwargs)
+
     def get(self, item: Any, default: Any = None) -> Optional[Any]:
         try:
             return self.__getitem__(item)
         except KeyError:
             return default
+
+
+def _is_plain_key(key: Any) -> bool:
+    # Return whether matching key only depends on the runtime type of an item,
+    # which is the case for non-generic classes without custom checks.
+    if key is Any or key is object:
+        return True
+    if not isinstance(key, type):
+        return False
+    capabilities = get_capabilities(key)
+    return (not capabilities.is_from_typing
+            and not capabilities.has_instancecheck
+            and not capabilities.has_subclasscheck)
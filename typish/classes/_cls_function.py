@@ -4,6 +4,7 @@ from typing import Callable, Any, Union, Iterable, Dict, Tuple
 
 from typish._types import Empty
 from typish.classes._cls_dict import ClsDict
+from typish.functions._instance_of import instance_of
 
 
 class ClsFunction:
@@ -16,8 +17,6 @@ class ClsFunction:
                                    Dict[type, Callable],
                                    Iterable[Tuple[type, Callable]],
                                    Iterable[Callable]]):
-        from typish.functions._instance_of import instance_of
-
         if isinstance(body, ClsDict):
             self.body = body
         elif isinstance(body, dict):
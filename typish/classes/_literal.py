@@ -1,6 +1,8 @@
 import typing
 
 from typish.classes._subscriptable_type import SubscriptableType
+from typish.functions._get_args import get_args
+from typish.functions._get_simple_name import get_simple_name
 
 
 def is_literal_type(cls: typing.Any) -> bool:
@@ -9,8 +11,6 @@ def is_literal_type(cls: typing.Any) -> bool:
     :param cls: the type that is to be checked.
     :return: True if cls is a Literal type.
     """
-    from typish.functions._get_simple_name import get_simple_name
-
     return get_simple_name(cls) == 'Literal'
 
 
@@ -26,13 +26,13 @@ class _LiteralMeta(SubscriptableType):
         :return: the attribute.
         """
         if item == '__args__':
+            cls_dict = SubscriptableType.__getattribute__(cls, '__dict__')
+            if '_args' in cls_dict:
+                # The args were normalized upon subscription.
+                return cls_dict['_args']
             try:
-                result = SubscriptableType.__getattribute__(cls, item)
-                if (result and isinstance(result, tuple)
-                        and isinstance(result[0], tuple)):
-                    result = result[0]  # result was a tuple in a tuple.
-                if result and not isinstance(result, tuple):
-                    result = (result,)
+                result = _normalize_args(
+                    SubscriptableType.__getattribute__(cls, item))
             except AttributeError:  # pragma: no cover
                 # In case of Python 3.5
                 result = tuple()
@@ -43,7 +43,10 @@ class _LiteralMeta(SubscriptableType):
         return result
 
     def __instancecheck__(self, instance):
-        return self.__args__ and instance in self.__args__
+        literal_values = self.__dict__.get('_literal_values')
+        if literal_values is None:
+            return self.__args__ and instance in self.__args__
+        return instance in literal_values
 
     def __str__(self):
         args = ', '.join(str(arg) for arg in self.__args__)
@@ -64,11 +67,70 @@ class LiteralAlias(type, metaclass=_LiteralMeta):
         :param literal: the typing.Literal type.
         :return: a LiteralAlias type.
         """
-        from typish.functions._get_args import get_args
-
         args = get_args(literal)
         return LiteralAlias[args] if args else LiteralAlias
 
+    @classmethod
+    def _after_subscription(cls, item: typing.Any) -> None:
+        # Normalize the args once and index them for fast instance checks.
+        cls._args = _normalize_args(item)
+        cls._literal_values = LiteralValues(cls._args or ())
+
+
+class LiteralValues:
+    """
+    The values of a Literal, indexed for fast membership tests. Unlike with a
+    tuple, ``True`` and ``1`` are not considered equal, like with
+    typing.Literal.
+    """
+    def __init__(self, values: typing.Iterable[typing.Any]) -> None:
+        """
+        Constructor.
+        :param values: the values of a Literal.
+        """
+        self.values = tuple(values)
+        keys = set()
+        unhashables = []
+        for value in self.values:
+            try:
+                keys.add(_to_key(value))
+            except TypeError:
+                unhashables.append(value)
+        self._keys = frozenset(keys)
+        self._unhashables = tuple(unhashables)
+
+    def __contains__(self, obj: object) -> bool:
+        try:
+            return (_to_key(obj) in self._keys
+                    or self._in(obj, self._unhashables))
+        except TypeError:
+            # obj is unhashable; compare it to all values.
+            return self._in(obj, self.values)
+
+    def __bool__(self) -> bool:
+        return bool(self.values)
+
+    @staticmethod
+    def _in(obj: object, values: typing.Tuple[typing.Any, ...]) -> bool:
+        # Check membership by comparing obj to each value.
+        key = _to_key(obj)
+        return any(key == _to_key(value) for value in values)
+
+
+def _normalize_args(args: typing.Any) -> typing.Any:
+    # Make sure that args is a tuple (if not empty).
+    if args and isinstance(args, tuple) and isinstance(args[0], tuple):
+        args = args[0]  # args was a tuple in a tuple.
+    if args and not isinstance(args, tuple):
+        args = (args,)
+    return args
+
+
+def _to_key(value: typing.Any) -> typing.Hashable:
+    # Return a key for value that tells apart booleans and other numbers. The
+    # key is hashable if value is.
+    return isinstance(value, bool), value
+
 
 # If Literal is available (Python 3.8+), then return that type instead.
 Literal = getattr(typing, 'Literal', LiteralAlias)
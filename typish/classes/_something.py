@@ -1,8 +1,21 @@
 import types
 from collections import OrderedDict
-from typing import Any, Dict, Callable, Tuple
+from collections.abc import Mapping
+from inspect import getattr_static, isdatadescriptor
+from typing import Any, Dict, Callable, Iterable, Iterator, Optional, Tuple
+from weakref import WeakKeyDictionary
 
+from typish._capabilities import get_capabilities
 from typish.classes._subscriptable_type import SubscriptableType
+from typish.functions._callable_compatibility import (
+    Shape,
+    get_shape,
+    is_shape_compatible,
+)
+from typish.functions._compile import compile
+from typish.functions._get_type import get_type
+from typish.functions._get_type_hints_of_callable import get_args_and_return_type
+from typish.functions._subclass_of import subclass_of
 
 
 class _SomethingMeta(SubscriptableType):
@@ -12,43 +25,60 @@ class _SomethingMeta(SubscriptableType):
     def __instancecheck__(self, instance: object) -> bool:
         # Check if all attributes from self.signature are also present in
         # instance and also check that their types correspond.
-        from typish.functions._instance_of import instance_of
-
-        sig = self.signature()
-        for key in sig:
+        checkers = self._checkers
+        if checkers is None:
+            # The signature is lazy; its types are needed now.
+            checkers = self._checkers = _compile_signature(self._signature)
+        for key, checker in checkers:
             attr = getattr(instance, key, None)
-            if not attr or not instance_of(attr, sig[key]):
+            if not attr or not checker(attr):
                 return False
         return True
 
     def __subclasscheck__(self, subclass: type) -> bool:
+        # The result is cached per subclass, since it requires the types of
+        # all attributes of subclass.
+        try:
+            return self._subclass_check_per_cls[subclass]
+        except (KeyError, TypeError):
+            pass
+        result = self._subclass_check(subclass)
+        try:
+            self._subclass_check_per_cls[subclass] = result
+        except TypeError:
+            pass  # subclass cannot be weakly referenced.
+        return result
+
+    def _subclass_check(self, subclass: type) -> bool:
         # If an instance of type subclass is an instance of self, then subclass
         # is a sub class of self.
-        from typish.functions._subclass_of import subclass_of
-        from typish.functions._get_type_hints_of_callable import get_args_and_return_type
-
-        self_sig = self.signature()
-        other_sig = Something.like(subclass).signature()
+        self_sig = self._signature
+        other_sig = Something.like(subclass, lazy=True)._signature
         for attr in self_sig:
             if attr in other_sig:
-                attr_sig = other_sig[attr]
-                if (not isinstance(subclass.__dict__[attr], staticmethod)
-                        and not isinstance(subclass.__dict__[attr], classmethod)
-                        and subclass_of(attr_sig, Callable)):
-                    # The attr must be a regular method or class method, so the
-                    # first parameter should be ignored.
-                    args, rt = get_args_and_return_type(attr_sig)
-                    attr_sig = Callable[list(args[1:]), rt]
-                if not subclass_of(attr_sig, self_sig[attr]):
+                shape = _get_method_shape(subclass, attr)
+                if (shape is not None
+                        and get_capabilities(self_sig[attr]).origin
+                        is Callable):
+                    # Methods are matched by their signature, as seen from an
+                    # instance.
+                    compatible = _is_compatible_method(shape, self_sig[attr])
+                else:
+                    compatible = subclass_of(other_sig[attr], self_sig[attr])
+                if not compatible:
                     return False
         return True
 
     def __eq__(self, other: 'Something') -> bool:
+        # The unsubscripted Something has no signature.
         return (isinstance(other, _SomethingMeta)
-                and self.signature() == other.signature())
+                and getattr(self, '_signature', None)
+                == getattr(other, '_signature', None))
 
     def __repr__(self):
-        sig = self.signature()
+        sig = getattr(self, '_signature', None)
+        if sig is None:
+            return 'typish.Something'
         sig_ = ', '.join(["'{}': {}".format(k, self._type_repr(sig[k]))
                           for k in sig])
         return 'typish.Something[{}]'.format(sig_)
@@ -85,19 +115,20 @@ class Something(type, metaclass=_SomethingMeta):
         Return the signature of this ``Something`` as a dict.
         :return: a dict with attribute names as keys and types as values.
         """
-        result = OrderedDict()
-        args = mcs.__args__
-        if isinstance(mcs.__args__, slice):
-            args = (mcs.__args__,)
-
-        arg_keys = sorted(args)
-        if isinstance(mcs.__args__, dict):
-            for key in arg_keys:
-                result[key] = mcs.__args__[key]
+        return OrderedDict(mcs._signature)
+
+    @classmethod
+    def _after_subscription(mcs, item: Any) -> None:
+        # Compute the signature and compile its types once, rather than upon
+        # every instance check.
+        if isinstance(item, _LazySignature):
+            # Compile upon the first instance check, which needs all types.
+            mcs._signature = item
+            mcs._checkers = None
         else:
-            for slice_ in arg_keys:
-                result[slice_.start] = slice_.stop
-        return result
+            mcs._signature = _to_signature(item)
+            mcs._checkers = _compile_signature(mcs._signature)
+        mcs._subclass_check_per_cls = WeakKeyDictionary()
 
     def __getattr__(cls, item):
         # This method exists solely to fool the IDE into believing that
@@ -105,18 +136,113 @@ class Something(type, metaclass=_SomethingMeta):
         return type.__getattr__(cls, item)  # pragma: no cover
 
     @staticmethod
-    def like(obj: Any, exclude_privates: bool = True) -> 'Something':
+    def like(
+            obj: Any,
+            exclude_privates: bool = True,
+            lazy: bool = False,
+            exclude_descriptors: bool = False) -> 'Something':
         """
         Return a ``Something`` for the given ``obj``.
         :param obj: the object of which a ``Something`` is to be made.
         :param exclude_privates: if ``True``, private variables are excluded.
+        :param lazy: if ``True``, the type of an attribute is only inferred
+        when it is needed, rather than for all attributes at once.
+        :param exclude_descriptors: if ``True``, attributes that are data
+        descriptors (such as properties) are excluded without being evaluated.
         :return: a ``Something`` that corresponds to ``obj``.
         """
-        from typish.functions._get_type import get_type
-
-        signature = {attr: get_type(getattr(obj, attr)) for attr in dir(obj)
-                     if not exclude_privates or not attr.startswith('_')}
+        attrs = [attr for attr in dir(obj)
+                 if (not exclude_privates or not attr.startswith('_'))
+                 and not (exclude_descriptors
+                          and _is_data_descriptor(obj, attr))]
+        if lazy:
+            return Something[_LazySignature(obj, attrs)]
+        signature = {attr: get_type(getattr(obj, attr)) for attr in attrs}
         return Something[signature]
 
 
+class _LazySignature(Mapping):
+    """
+    A signature of the attributes of an object of which the types are only
+    inferred upon first access.
+    """
+    def __init__(self, obj: Any, attrs: Iterable[str]) -> None:
+        self._obj = obj
+        self._attrs = tuple(sorted(attrs))
+        self._attr_set = frozenset(self._attrs)
+        self._type_per_attr = {}
+
+    def __getitem__(self, attr: str) -> type:
+        try:
+            return self._type_per_attr[attr]
+        except KeyError:
+            if attr not in self._attr_set:
+                raise
+        result = get_type(getattr(self._obj, attr))
+        self._type_per_attr[attr] = result
+        return result
+
+    def __contains__(self, attr: object) -> bool:
+        # Overridden, as Mapping would infer the type of attr.
+        return attr in self._attr_set
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._attrs)
+
+    def __len__(self) -> int:
+        return len(self._attrs)
+
+
+def _is_data_descriptor(obj: Any, attr: str) -> bool:
+    # Return whether attr of obj is a data descriptor, without invoking it.
+    try:
+        return isdatadescriptor(getattr_static(obj, attr))
+    except AttributeError:
+        return False
+
+
+def _compile_signature(
+        signature: Dict[str, type]) -> Tuple[Tuple[str, Callable], ...]:
+    # Compile a checker for each type in signature.
+    return tuple((key, compile(hint)) for key, hint in signature.items())
+
+
+def _get_method_shape(cls: type, attr: str) -> Optional[Shape]:
+    # Return the shape of the method attr of cls without the parameter that
+    # receives the instance or class, or None if attr is not a method.
+    value = getattr_static(cls, attr, None)
+    if isinstance(value, staticmethod):
+        return get_shape(value.__func__)
+    if isinstance(value, classmethod):
+        value = value.__func__
+    elif not isinstance(value, types.FunctionType):
+        return None
+    parameters, return_type = get_shape(value)
+    return parameters[1:], return_type
+
+
+def _is_compatible_method(shape: Shape, hint: Any) -> bool:
+    # Return whether a method of shape is compatible with a Callable hint.
+    arg_types, return_type = get_args_and_return_type(hint)
+    return (arg_types is None
+            or is_shape_compatible(shape, arg_types, return_type))
+
+
+def _to_signature(args: Any) -> Dict[str, type]:
+    # Convert the args of a subscription of Something (a dict or slices) to a
+    # signature.
+    result = OrderedDict()
+    if isinstance(args, slice):
+        args = (args,)
+
+    arg_keys = sorted(args)
+    if isinstance(args, dict):
+        for key in arg_keys:
+            result[key] = args[key]
+    else:
+        for slice_ in arg_keys:
+            result[slice_.start] = slice_.stop
+    return result
+
+
 TypingType = Something['__origin__': type, '__args__': Tuple[type, ...]]
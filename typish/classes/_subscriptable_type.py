@@ -1,3 +1,9 @@
+import copyreg
+import operator
+import typing
+from weakref import WeakValueDictionary
+
+
 class _SubscribedType(type):
     """
     This class is a placeholder to let the IDE know the attributes of the
@@ -23,21 +29,42 @@ class SubscriptableType(type):
         mcs._hash = None
         mcs.__args__ = None
         mcs.__origin__ = None
+        copyreg.pickle(mcs, _reduce_subscriptable_type)
 
     def __getitem__(self, item) -> _SubscribedType:
+        # Subscriptions are interned: subscribing with the same item twice
+        # gives the same type, for as long as that type is in use.
+        try:
+            key = id(self), _to_key(item)
+            interned = _subscribed_types[key]
+            # Args that hold lists or dicts may have changed since interning.
+            if (not interned.__dict__['_has_mutable_args']
+                    or _to_key(interned.__args__) == key[1]):
+                return interned
+        except TypeError:
+            key = None  # item is unhashable; it cannot be interned.
+        except KeyError:
+            pass
+
         body = {
             **self.__dict__,
             '__args__': item,
             '__origin__': self,
+            '_hash': None,
+            '_has_mutable_args': _has_mutable_args(item),
         }
         bases = self, *self.__bases__
         result = type(self.__name__, bases, body)
         if hasattr(result, '_after_subscription'):
             # TODO check if _after_subscription is static
             result._after_subscription(item)
+        if key:
+            _subscribed_types[key] = result
         return result
 
     def __eq__(self, other):
+        if not _is_subscribed(self):
+            return self is other
         self_args = getattr(self, '__args__', None)
         self_origin = getattr(self, '__origin__', None)
         other_args = getattr(other, '__args__', None)
@@ -45,6 +72,75 @@ class SubscriptableType(type):
         return self_args == other_args and self_origin == other_origin
 
     def __hash__(self):
+        if not _is_subscribed(self):
+            return type.__hash__(self)
         if not getattr(self, '_hash', None):
-            self._hash = hash('{}{}'.format(self.__origin__, self.__args__))
+            origin = getattr(self, '__origin__', None)
+            args = getattr(self, '__args__', None)
+            self._hash = hash((origin, _to_hashable(args)))
         return self._hash
+
+
+def _is_subscribed(cls: SubscriptableType) -> bool:
+    # Return whether cls is the result of subscribing some type.
+    return '__origin__' in cls.__dict__
+
+
+def _to_key(obj: typing.Any) -> typing.Hashable:
+    # Return a hashable key for obj that, unlike obj itself, also tells apart
+    # objects that are equal but of a different type, such as 1 and True.
+    # Raise a TypeError if obj contains anything unhashable.
+    if isinstance(obj, (tuple, list)):
+        return type(obj), tuple(_to_key(elem) for elem in obj)
+    if isinstance(obj, dict):
+        return type(obj), tuple((_to_key(key), _to_key(value))
+                                for key, value in obj.items())
+    if isinstance(obj, slice):
+        return slice, _to_key(obj.start), _to_key(obj.stop), _to_key(obj.step)
+    hash(obj)
+    return type(obj), obj
+
+
+def _has_mutable_args(obj: typing.Any) -> bool:
+    # Return whether obj is or contains a list or a dict.
+    if isinstance(obj, (list, dict)):
+        return True
+    if isinstance(obj, tuple):
+        return any(_has_mutable_args(elem) for elem in obj)
+    if isinstance(obj, slice):
+        return any(_has_mutable_args(elem)
+                   for elem in (obj.start, obj.stop, obj.step))
+    return False
+
+
+def _to_hashable(obj: typing.Any) -> typing.Hashable:
+    # Return a hashable counterpart of obj that is equal for equal objects.
+    if isinstance(obj, (tuple, list)):
+        return tuple(_to_hashable(elem) for elem in obj)
+    if isinstance(obj, dict):
+        return frozenset((_to_hashable(key), _to_hashable(value))
+                         for key, value in obj.items())
+    if isinstance(obj, slice):
+        return (slice, _to_hashable(obj.start), _to_hashable(obj.stop),
+                _to_hashable(obj.step))
+    try:
+        hash(obj)
+    except TypeError:
+        # Equal objects must hash equally, so all unhashables hash the same.
+        return None
+    return obj
+
+
+def _reduce_subscriptable_type(cls: SubscriptableType):
+    # Allow subscripted types to be pickled by subscripting their origin again
+    # when unpickling. Other types are pickled by reference, like any class.
+    if not _is_subscribed(cls):
+        return cls.__qualname__
+    return operator.getitem, (cls.__dict__['__origin__'], cls.__args__)
+
+
+copyreg.pickle(SubscriptableType, _reduce_subscriptable_type)
+
+# The subscribed types by the id of their origin and the key of their args.
+# An origin outlives its subscribed types, as they refer to it.
+_subscribed_types = WeakValueDictionary()
@@ -0,0 +1,278 @@
+import typing
+
+from typish._capabilities import get_capabilities
+from typish._state import DEFAULT, State
+from typish.functions._compile import _get_alias, compile
+
+
+class ValidatedList(list):
+    """
+    A list that is bound to a type hint such as ``List[int]``. Upon each
+    mutation, only the inserted or replaced elements are checked against the
+    hint and a running verdict is kept, so ``is_valid`` costs O(1) instead of
+    a walk over all elements.
+
+    Elements that are mutated in place are not seen; call ``revalidate`` to
+    check all elements again.
+    """
+    def __init__(
+            self,
+            hint: typing.Any,
+            iterable: typing.Iterable = (),
+            *,
+            state: State = DEFAULT) -> None:
+        """
+        Constructor.
+        :param hint: the type hint of the list, e.g. ``List[int]``.
+        :param iterable: the initial elements of the list.
+        :param state: any state that is used by typish.
+        """
+        element_hint, = _get_element_hints(hint, list, 1)
+        super().__init__()
+        self.hint = hint
+        self._check = compile(element_hint, state=state)
+        self._state = state
+        self._valid_flags = []
+        self._invalid_count = 0
+        self.extend(iterable)
+
+    @property
+    def is_valid(self) -> bool:
+        """
+        Return whether all elements of this list are instances of the element
+        type of its hint.
+        :return: ``True`` if this list is an instance of its hint.
+        """
+        return not self._invalid_count
+
+    def revalidate(self) -> bool:
+        """
+        Check all elements again, to account for elements that were mutated in
+        place.
+        :return: ``True`` if this list is an instance of its hint.
+        """
+        self._valid_flags = [self._check(elem) for elem in self]
+        self._invalid_count = self._valid_flags.count(False)
+        return self.is_valid
+
+    def append(self, obj: typing.Any) -> None:
+        valid = self._check(obj)
+        super().append(obj)
+        self._valid_flags.append(valid)
+        self._invalid_count += not valid
+
+    def extend(self, iterable: typing.Iterable) -> None:
+        for obj in iterable:
+            self.append(obj)
+
+    def insert(self, index: int, obj: typing.Any) -> None:
+        valid = self._check(obj)
+        super().insert(index, obj)
+        self._valid_flags.insert(index, valid)
+        self._invalid_count += not valid
+
+    def __setitem__(self, index: typing.Union[int, slice], obj: typing.Any):
+        if isinstance(index, slice):
+            obj = list(obj)
+            valid = [self._check(elem) for elem in obj]
+            invalid_count = valid.count(False)
+            old_invalid_count = self._valid_flags[index].count(False)
+        else:
+            valid = self._check(obj)
+            invalid_count = int(not valid)
+            old_invalid_count = int(not self._valid_flags[index])
+        super().__setitem__(index, obj)
+        self._valid_flags[index] = valid
+        self._invalid_count += invalid_count - old_invalid_count
+
+    def __delitem__(self, index: typing.Union[int, slice]) -> None:
+        super().__delitem__(index)
+        self._remove_flags(index)
+
+    def pop(self, index: int = -1) -> typing.Any:
+        result = super().pop(index)
+        self._remove_flags(index)
+        return result
+
+    def remove(self, obj: typing.Any) -> None:
+        del self[self.index(obj)]
+
+    def clear(self) -> None:
+        super().clear()
+        self._valid_flags.clear()
+        self._invalid_count = 0
+
+    def sort(self, *, key=None, reverse: bool = False) -> None:
+        # Sort the flags along with the elements.
+        order = sorted(range(len(self)),
+                       key=lambda i: key(self[i]) if key else self[i],
+                       reverse=reverse)
+        super().__setitem__(slice(None), [self[i] for i in order])
+        self._valid_flags = [self._valid_flags[i] for i in order]
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._valid_flags.reverse()
+
+    def __iadd__(self, iterable: typing.Iterable) -> 'ValidatedList':
+        self.extend(iterable)
+        return self
+
+    def __imul__(self, times: int) -> 'ValidatedList':
+        super().__imul__(times)
+        self._valid_flags *= times
+        self._invalid_count = max(times, 0) * self._invalid_count
+        return self
+
+    def __reduce__(self):
+        return _new_validated_list, (self.hint, list(self),
+                                     _pickled_state(self._state))
+
+    def _remove_flags(self, index: typing.Union[int, slice]) -> None:
+        removed = self._valid_flags[index]
+        del self._valid_flags[index]
+        if isinstance(index, slice):
+            self._invalid_count -= removed.count(False)
+        else:
+            self._invalid_count -= not removed
+
+
+class ValidatedDict(dict):
+    """
+    A dict that is bound to a type hint such as ``Dict[str, int]``. Upon each
+    mutation, only the inserted or replaced items are checked against the hint
+    and a running verdict is kept, so ``is_valid`` costs O(1) instead of a walk
+    over all items.
+
+    Values that are mutated in place are not seen; call ``revalidate`` to
+    check all items again.
+    """
+    def __init__(
+            self,
+            hint: typing.Any,
+            *args: typing.Any,
+            state: State = DEFAULT,
+            **kwargs: typing.Any) -> None:
+        """
+        Constructor.
+        :param hint: the type hint of the dict, e.g. ``Dict[str, int]``.
+        :param args: the initial items, like with ``dict``.
+        :param state: any state that is used by typish.
+        :param kwargs: the initial items, like with ``dict``.
+        """
+        key_hint, value_hint = _get_element_hints(hint, dict, 2)
+        super().__init__()
+        self.hint = hint
+        self._check_key = compile(key_hint, state=state)
+        self._check_value = compile(value_hint, state=state)
+        self._state = state
+        self._invalid_keys = set()
+        self.update(*args, **kwargs)
+
+    @property
+    def is_valid(self) -> bool:
+        """
+        Return whether all keys and values of this dict are instances of the
+        key and value types of its hint.
+        :return: ``True`` if this dict is an instance of its hint.
+        """
+        return not self._invalid_keys
+
+    def revalidate(self) -> bool:
+        """
+        Check all items again, to account for values that were mutated in
+        place.
+        :return: ``True`` if this dict is an instance of its hint.
+        """
+        self._invalid_keys = {key for key, value in self.items()
+                              if not self._is_valid_item(key, value)}
+        return self.is_valid
+
+    def __setitem__(self, key: typing.Any, value: typing.Any) -> None:
+        super().__setitem__(key, value)
+        if self._is_valid_item(key, value):
+            self._invalid_keys.discard(key)
+        else:
+            self._invalid_keys.add(key)
+
+    def __delitem__(self, key: typing.Any) -> None:
+        super().__delitem__(key)
+        self._invalid_keys.discard(key)
+
+    def pop(self, key: typing.Any, *default: typing.Any) -> typing.Any:
+        self._invalid_keys.discard(key)
+        return super().pop(key, *default)
+
+    def popitem(self) -> typing.Tuple[typing.Any, typing.Any]:
+        key, value = super().popitem()
+        self._invalid_keys.discard(key)
+        return key, value
+
+    def setdefault(self, key: typing.Any, default: typing.Any = None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        if len(args) > 1:
+            raise TypeError('update expected at most 1 argument, got {}'
+                            .format(len(args)))
+        if args:
+            other = args[0]
+            if hasattr(other, 'keys'):
+                for key in other.keys():
+                    self[key] = other[key]
+            else:
+                for key, value in other:
+                    self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def clear(self) -> None:
+        super().clear()
+        self._invalid_keys.clear()
+
+    def __ior__(self, other: typing.Any) -> 'ValidatedDict':
+        self.update(other)
+        return self
+
+    def __reduce__(self):
+        return _new_validated_dict, (self.hint, dict(self),
+                                     _pickled_state(self._state))
+
+    def _is_valid_item(self, key: typing.Any, value: typing.Any) -> bool:
+        return self._check_key(key) and self._check_value(value)
+
+
+def _get_element_hints(
+        hint: typing.Any,
+        origin: type,
+        number_of_args: int) -> typing.Tuple[typing.Any, ...]:
+    # Return the args of hint, which must be a generic of origin.
+    capabilities = get_capabilities(_get_alias(hint))
+    if not (isinstance(capabilities.origin, type)
+            and issubclass(origin, capabilities.origin)):
+        raise TypeError('Expected a hint of {}, got {}.'.format(origin, hint))
+    args = capabilities.args
+    return args if len(args) == number_of_args else (typing.Any,) * number_of_args
+
+
+def _pickled_state(state: State) -> typing.Optional[State]:
+    # Use None for the default state, so that it is not copied by pickling.
+    return None if state is DEFAULT else state
+
+
+def _new_validated_list(
+        hint: typing.Any,
+        elems: list,
+        state: typing.Optional[State]) -> ValidatedList:
+    # Recreate a ValidatedList when unpickling.
+    return ValidatedList(hint, elems, state=state or DEFAULT)
+
+
+def _new_validated_dict(
+        hint: typing.Any,
+        items: dict,
+        state: typing.Optional[State]) -> ValidatedDict:
+    # Recreate a ValidatedDict when unpickling.
+    return ValidatedDict(hint, items, state=state or DEFAULT)
@@ -0,0 +1,282 @@
+import ast
+import dis
+import io
+import linecache
+import re
+import sys
+import tokenize
+from types import CodeType, MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# A comment with a type hint in MyPy style, e.g. '# type: int'.
+_TYPE_COMMENT = re.compile(r'#\s*type\s*:\s*(?!ignore\b)(.+?)\s*$')
+
+# The instructions that load a function before it is called (before Python
+# 3.11).
+_ATTR_LOAD_OPS = {'LOAD_ATTR', 'LOAD_METHOD'}
+_LOAD_OPS = {'LOAD_GLOBAL', 'LOAD_NAME', 'LOAD_FAST', 'LOAD_DEREF',
+             'LOAD_CLASSDEREF'} | _ATTR_LOAD_OPS
+
+
+class CallHint:
+    """
+    A call in the source of a module and the type hint that receives its
+    result.
+    """
+    def __init__(
+            self,
+            call: ast.Call,
+            name: str,
+            filename: str,
+            annotation: Optional[ast.expr],
+            type_comment: Optional[str]) -> None:
+        self.lineno = call.lineno
+        self.end_lineno = getattr(call, 'end_lineno', call.lineno)
+        self.col_offset = call.col_offset
+        self.name = name
+        self._filename = filename
+        self._annotation = annotation
+        self._type_comment = type_comment
+
+    def get_hint(self, f_globals: Dict[str, Any]) -> Any:
+        """
+        Return the hint of this call, evaluated in the given globals.
+        :param f_globals: the globals of the module of the call.
+        :return: the hint as a type if it can be evaluated, otherwise as a
+        string or None if there is no hint.
+        """
+        annotation = self._annotation
+        if annotation is None:
+            return _from_string(self._type_comment, f_globals)
+        # A string annotation is a Constant (or a Str before Python 3.8).
+        text = getattr(annotation, 'value', getattr(annotation, 's', None))
+        if isinstance(text, str):
+            return _from_string(text, f_globals)
+        try:
+            expression = compile(ast.Expression(annotation), self._filename,
+                                 'eval')
+            return eval(expression, f_globals)
+        except Exception:
+            # The hint cannot be resolved (e.g. it refers to a local name).
+            return _unparse(annotation)
+
+
+class ModuleIndex:
+    """
+    An index of all calls in the source of a module, with the type hint that
+    receives the result of each call through an annotated assignment, an
+    annotated parameter with a default or a type comment.
+    """
+    def __init__(self, source: str, filename: str) -> None:
+        self.calls_per_name = {}
+        try:
+            tree = ast.parse(source, filename)
+        except (SyntaxError, ValueError):
+            return
+        type_comments = _get_type_comments(source)
+        for call, name, annotation, type_comment in _find_calls(
+                tree, type_comments):
+            call_hint = CallHint(call, name, filename, annotation,
+                                 type_comment)
+            self.calls_per_name.setdefault(name, []).append(call_hint)
+        for calls in self.calls_per_name.values():
+            calls.sort(key=lambda call: (call.lineno, call.col_offset))
+
+
+def get_hint_per_offset(
+        code: CodeType,
+        name: str,
+        f_globals: Dict[str, Any]) -> Mapping[int, Any]:
+    """
+    Return the hints of all calls of the function with the given name in the
+    given code, by the offset of the instruction that makes the call (which
+    is the ``f_lasti`` of the calling frame). The result is read-only, so it
+    can be shared by threads and coroutines without any locking.
+    :param code: the code of the caller.
+    :param name: the name of the called function.
+    :param f_globals: the globals of the module of the caller.
+    :return: a read-only mapping of offsets to hints.
+    """
+    index = get_module_index(code, f_globals)
+    calls = index.calls_per_name.get(name, [])
+    if hasattr(code, 'co_positions'):
+        call_per_offset = _match_by_position(code, calls)
+    else:
+        call_per_offset = _match_by_order(code, name, calls)
+    return MappingProxyType({offset: call.get_hint(f_globals)
+                             for offset, call in call_per_offset.items()})
+
+
+def get_module_index(
+        code: CodeType,
+        f_globals: Dict[str, Any]) -> ModuleIndex:
+    """
+    Return the index of the module of the given code. The source of a module
+    is parsed once, as long as linecache holds the same source.
+    :param code: some code of the module.
+    :param f_globals: the globals of the module.
+    :return: a ModuleIndex.
+    """
+    filename = code.co_filename
+    lines = linecache.getlines(filename, f_globals)
+    cached = _index_per_filename.get(filename)
+    if cached and cached[0] is lines:
+        return cached[1]
+    index = ModuleIndex(''.join(lines), filename)
+    _index_per_filename[filename] = lines, index
+    return index
+
+
+def _match_by_position(
+        code: CodeType,
+        calls: List[CallHint]) -> Dict[int, CallHint]:
+    # Match the instructions of code to calls by their source position
+    # (Python 3.11+). Offsets are in bytes, like f_lasti.
+    call_per_position = {(call.lineno, call.col_offset): call
+                         for call in calls}
+    result = {}
+    for index, (lineno, _, col_offset, _) in enumerate(code.co_positions()):
+        call = call_per_position.get((lineno, col_offset))
+        if call:
+            result[index * 2] = call
+    return result
+
+
+def _match_by_order(
+        code: CodeType,
+        name: str,
+        calls: List[CallHint]) -> Dict[int, CallHint]:
+    # Match the instructions of code to calls by their order on a line: the
+    # n-th load of the function on a line is the n-th call on that line. The
+    # stack depth is tracked to find the instruction that calls that load.
+    # All offsets of a call instruction are matched, since f_lasti may point
+    # to its inline caches.
+    calls_per_line = {}
+    for call in calls:
+        calls_per_line.setdefault(call.lineno, []).append(call)
+    loads_per_line = {}
+    pending = []
+    result = {}
+    depth = 0
+    lineno = code.co_firstlineno
+    previous_opname = None
+    instructions = list(dis.get_instructions(code))
+    end_offsets = [instruction.offset for instruction in instructions[1:]]
+    end_offsets.append(len(code.co_code))
+    for instruction, end_offset in zip(instructions, end_offsets):
+        lineno = instruction.starts_line or lineno
+        if instruction.opname in _LOAD_OPS and instruction.argval == name:
+            loads = loads_per_line.setdefault(lineno, [])
+            line_calls = calls_per_line.get(lineno, [])
+            call = (line_calls[len(loads)]
+                    if len(loads) < len(line_calls) else None)
+            loads.append(instruction)
+            # An attribute is loaded from an object that is already on the
+            # stack, as is a NULL that is pushed before some loads.
+            base = depth - (instruction.opname in _ATTR_LOAD_OPS
+                            or previous_opname == 'PUSH_NULL')
+            pending.append((base, call))
+        depth += _stack_effect(instruction)
+        previous_opname = instruction.opname
+        if (instruction.opname.startswith('CALL') and pending
+                and depth == pending[-1][0] + 1):
+            _, call = pending.pop()
+            if call:
+                for offset in range(instruction.offset, end_offset, 2):
+                    result[offset] = call
+    return result
+
+
+def _stack_effect(instruction: dis.Instruction) -> int:
+    # Return the effect of instruction on the stack depth if it does not jump.
+    # Before Python 3.8, jump cannot be given and the maximum effect of both
+    # paths is returned, which makes no difference for the loads and calls of
+    # a single expression.
+    if sys.version_info < (3, 8):
+        return dis.stack_effect(instruction.opcode, instruction.arg)
+    return dis.stack_effect(instruction.opcode, instruction.arg, jump=False)
+
+
+def _find_calls(
+        tree: ast.AST,
+        type_comments: Dict[int, str]) -> Iterable[
+            Tuple[ast.Call, str, Optional[ast.expr], Optional[str]]]:
+    # Yield each call with the name of the called function and the
+    # annotation and the type comment that it receives, if any.
+    hint_per_call = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.AnnAssign) and node.value:
+            targets = [(node.value, node.annotation, None)]
+        elif isinstance(node, ast.Assign):
+            end_lineno = getattr(node, 'end_lineno', node.lineno)
+            targets = [(node.value, None, type_comments.get(end_lineno))]
+        elif isinstance(node, ast.arguments):
+            targets = _get_annotated_defaults(node)
+        else:
+            continue
+        for value, annotation, type_comment in targets:
+            if annotation is not None or type_comment is not None:
+                for call in ast.walk(value):
+                    hint_per_call[call] = annotation, type_comment
+    for call in ast.walk(tree):
+        name = isinstance(call, ast.Call) and _get_name(call.func)
+        if name:
+            annotation, type_comment = hint_per_call.get(call, (None, None))
+            yield call, name, annotation, type_comment
+
+
+def _get_annotated_defaults(
+        arguments: ast.arguments) -> List[Tuple[ast.expr, ast.expr, None]]:
+    # Return the defaults of the given arguments with their annotations.
+    args = arguments.args
+    positional = zip(args[len(args) - len(arguments.defaults):],
+                     arguments.defaults)
+    keyword = zip(arguments.kwonlyargs, arguments.kw_defaults)
+    return [(default, arg.annotation, None)
+            for arg, default in list(positional) + list(keyword)
+            if default is not None and arg.annotation is not None]
+
+
+def _get_name(func: ast.expr) -> Optional[str]:
+    # Return the name of a called function, e.g. 'cast' for x.cast().
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return None
+
+
+def _get_type_comments(source: str) -> Dict[int, str]:
+    # Return the hints in MyPy-style type comments per line number.
+    result = {}
+    try:
+        tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+        for token in tokens:
+            if token.type == tokenize.COMMENT:
+                match = _TYPE_COMMENT.match(token.string)
+                if match:
+                    result[token.start[0]] = match.group(1)
+    except (tokenize.TokenError, SyntaxError):
+        pass
+    return result
+
+
+def _from_string(hint: Optional[str], f_globals: Dict[str, Any]) -> Any:
+    # Evaluate a textual hint. If it does not evaluate to a type, the text
+    # itself is the hint.
+    hint = (hint or '').strip()
+    try:
+        result = eval(hint, f_globals)
+    except Exception:
+        return hint or None
+    return hint if isinstance(result, str) else result
+
+
+def _unparse(node: ast.expr) -> str:
+    # Return the source of an expression.
+    unparse = getattr(ast, 'unparse', None)
+    return unparse(node) if unparse else ast.dump(node)
+
+
+# The index of a module and the lines it was built from, per filename.
+_index_per_filename = {}
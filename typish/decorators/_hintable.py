@@ -1,14 +1,16 @@
 import inspect
-import re
+import sys
 from functools import wraps
-from typing import Dict, Optional, Callable, List
+from types import FrameType
+from typing import Any, Callable
+from weakref import WeakKeyDictionary
+
+from typish.decorators._hint_index import get_hint_per_offset
 
 _DEFAULT_PARAM_NAME = 'hint'
 
 
 class _Hintable:
-    _hints_per_frame = {}
-
     def __init__(
             self,
             decorated: Callable,
@@ -17,57 +19,33 @@ class _Hintable:
         self._decorated = decorated
         self._param = param
         self._stack_index = stack_index
+        # The hints are cached per code object of the callers and then per
+        # call site (instruction offset) in there. The cache is dropped along
+        # with the code objects (e.g. of functions that are collected).
+        self._hints_per_code = WeakKeyDictionary()
 
     def __call__(self, *args, **kwargs):
-        stack = inspect.stack()
-
-        previous_frame = stack[self._stack_index]
-        frame_id = id(previous_frame.frame)
-
-        if not self._hints_per_frame.get(frame_id):
-            code_context = previous_frame.code_context[0].strip()
-            hint_strs = self._extract_hints(code_context)
-            globals_ = previous_frame.frame.f_globals
-            # Store the type hint if any, otherwise the string, otherwise None.
-            hints = [self._to_cls(hint_str, globals_) or hint_str or None
-                     for hint_str in hint_strs]
-            self._hints_per_frame[frame_id] = hints
-
-        hint = (self._hints_per_frame.get(frame_id) or [None]).pop()
+        frame = sys._getframe(self._stack_index)
+        hint = self._get_hint(frame)
 
         kwargs_ = {**kwargs, self._param: kwargs.get(self._param, hint)}
         return self._decorated(*args, **kwargs_)
 
-    def _extract_hints(self, code_context: str) -> List[str]:
-        result = []
-        regex = (
-            r'.+?(:(.+?))?=\s*'  # e.g. 'x: int = ', $2 holds hint
-            r'.*?{}\s*\(.*?\)\s*'  # e.g. 'func(...) '
-            r'(#\s*type\s*:\s*(\w+))?\s*'  # e.g. '# type: int ', $4 holds hint
-        ).format(self._decorated.__name__)
-
-        # Find all matches and store them (reversed) in the resulting list.
-        for _, group2, _, group4 in re.findall(regex, code_context):
-            raw_hint = (group2 or group4).strip()
-            if self._is_between(raw_hint, '\'') or self._is_between(raw_hint, '"'):
-                # Remove any quotes that surround the hint.
-                raw_hint = raw_hint[1:-1].strip()
-            result.insert(0, raw_hint)
-
-        return result
-
-    def _is_between(self, subject: str, character: str) -> bool:
-        return subject.startswith(character) and subject.endswith(character)
-
-    def _to_cls(self, hint: str, f_globals: Dict[str, type]) -> Optional[type]:
-        return __builtins__.get(hint, f_globals.get(hint))
+    def _get_hint(self, frame: FrameType) -> Any:
+        # Return the hint of the call site that frame is currently at. The
+        # table of a code object is built once and never mutated afterwards,
+        # so concurrent callers only read it. If threads race to build the
+        # same table, they build equal tables and either one is kept.
+        code = frame.f_code
+        hint_per_offset = self._hints_per_code.get(code)
+        if hint_per_offset is None:
+            hint_per_offset = get_hint_per_offset(
+                code, self._decorated.__name__, frame.f_globals)
+            self._hints_per_code[code] = hint_per_offset
+        return hint_per_offset.get(frame.f_lasti)
 
 
 def _get_wrapper(decorated, param: str, stack_index: int):
-    @wraps(decorated)
-    def _wrapper(*args, **kwargs):
-        return _Hintable(decorated, param, stack_index)(*args, **kwargs)
-
     if isinstance(decorated, type):
         raise TypeError('Only functions and methods should be decorated with '
                         '\'hintable\', not classes.')
@@ -77,6 +55,12 @@ def _get_wrapper(decorated, param: str, stack_index: int):
                         'the name \'{}\'.'
                         .format(decorated.__name__, param))
 
+    hintable_ = _Hintable(decorated, param, stack_index)
+
+    @wraps(decorated)
+    def _wrapper(*args, **kwargs):
+        return hintable_(*args, **kwargs)
+
     return _wrapper
 
 
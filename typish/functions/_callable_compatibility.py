@@ -0,0 +1,183 @@
+import inspect
+import typing
+from abc import get_cache_token
+from functools import lru_cache
+from inspect import Parameter
+
+from typish._callable_cache import cached_per_callable, is_lambda
+from typish._types import Empty, NoneType, Unknown
+from typish.functions._get_type_hints_of_callable import (
+    get_args_and_return_type,
+    get_type_hints_of_callable,
+)
+
+# The kinds of parameters that can receive a positional argument.
+_POSITIONAL_KINDS = (int(Parameter.POSITIONAL_ONLY),
+                     int(Parameter.POSITIONAL_OR_KEYWORD))
+_VAR_POSITIONAL = int(Parameter.VAR_POSITIONAL)
+_KEYWORD_ONLY = int(Parameter.KEYWORD_ONLY)
+
+# The shape of a callable: for each parameter its kind, its type and whether
+# it has a default, followed by the return type. Unlike a Signature, a shape
+# is cheap to hash and leaves out what does not affect compatibility, such as
+# parameter names and the values of defaults.
+Shape = typing.Tuple[typing.Tuple[typing.Tuple[int, typing.Any, bool], ...],
+                     typing.Any]
+
+
+def is_callable_compatible(func: typing.Callable, hint: typing.Any) -> bool:
+    """
+    Return whether the given function or method can be used where a callable
+    of the given hint (e.g. ``Callable[[int], str]``) is expected. Parameters
+    are contravariant and the return type is covariant. Parameters with a
+    default may be left out and ``*args`` takes any surplus arguments.
+    :param func: a function or method.
+    :param hint: a ``Callable`` hint.
+    :return: True if ``func`` is compatible with ``hint``.
+    """
+    arg_types, return_type = get_args_and_return_type(hint)
+    if arg_types is None:
+        # A bare Callable.
+        return True
+    return is_shape_compatible(get_shape(func), arg_types, return_type)
+
+
+def is_shape_compatible(
+        shape: Shape,
+        arg_types: typing.Tuple[typing.Any, ...],
+        return_type: typing.Any) -> bool:
+    """
+    Return whether a callable of the given shape can be used where a callable
+    with the given argument types and return type is expected. Results are
+    memoized per shape and types.
+    :param shape: the shape of a callable.
+    :param arg_types: the argument types, or ``(...,)`` for any arguments.
+    :param return_type: the return type.
+    :return: True if ``shape`` is compatible.
+    """
+    # The cache token is part of the key, since an ABC that gets a new virtual
+    # subclass may change any result.
+    key = (shape, arg_types, return_type, get_cache_token())
+    try:
+        return _cache(*key)
+    except TypeError:
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable types are not cached.
+            return _is_compatible(*key)
+        raise
+
+
+def get_shape_of_hint(hint: typing.Any) -> Shape:
+    """
+    Return the shape of a callable of the given ``Callable`` hint.
+    :param hint: a ``Callable`` hint.
+    :return: a shape with positional-only parameters.
+    """
+    arg_types, return_type = get_args_and_return_type(hint)
+    if arg_types is None or arg_types == (...,):
+        # Any arguments are accepted.
+        parameters = ((_VAR_POSITIONAL, Empty, False),
+                      (int(Parameter.VAR_KEYWORD), Empty, False))
+    else:
+        parameters = tuple((int(Parameter.POSITIONAL_ONLY), arg_type, False)
+                           for arg_type in arg_types)
+    return parameters, return_type or Unknown
+
+
+@cached_per_callable
+def get_shape(func: typing.Callable) -> Shape:
+    """
+    Return the shape of the given function or method with the types that it
+    effectively has: string annotations are resolved, a missing return
+    annotation means ``None`` (or ``Unknown`` for a lambda) and a coroutine
+    function returns an ``Awaitable``.
+    :param func: a function or method.
+    :return: the shape of ``func``.
+    """
+    signature = inspect.signature(func)
+    hints = {}
+    if any(isinstance(annotation, str)
+           for annotation in getattr(func, '__annotations__', {}).values()):
+        try:
+            hints = get_type_hints_of_callable(func)
+        except Exception:
+            # Some annotations cannot be resolved; use them as they are.
+            pass
+    parameters = tuple((int(param.kind),
+                        _to_type(hints.get(param.name, param.annotation)),
+                        param.default is not Empty)
+                       for param in signature.parameters.values())
+    return_type = _to_type(hints.get('return', signature.return_annotation))
+    if is_lambda(func):
+        return_type = Unknown
+    elif return_type is Empty:
+        return_type = NoneType
+    if inspect.iscoroutinefunction(func):
+        return_type = typing.Awaitable[return_type]
+    return parameters, return_type
+
+
+def _is_compatible(
+        shape: Shape,
+        arg_types: typing.Tuple[typing.Any, ...],
+        return_type: typing.Any,
+        _: object) -> bool:
+    # Check the return type covariantly and then the parameters.
+    parameters, shape_return_type = shape
+    if not _is_subtype(shape_return_type, return_type):
+        return False
+    if arg_types == (...,):
+        # The arguments are not specified.
+        return True
+    return _accepts(parameters, arg_types)
+
+
+def _accepts(
+        parameters: typing.Tuple[typing.Tuple[int, typing.Any, bool], ...],
+        arg_types: typing.Tuple[typing.Any, ...]) -> bool:
+    # Return whether the parameters accept positional arguments of the given
+    # types. Each parameter must accept a super type of its argument type.
+    positional = [param for param in parameters
+                  if param[0] in _POSITIONAL_KINDS]
+    var_positional = [param for param in parameters
+                      if param[0] == _VAR_POSITIONAL]
+    if any(kind == _KEYWORD_ONLY and not has_default
+           for kind, _, has_default in parameters):
+        # A required keyword-only parameter never receives an argument.
+        return False
+    if not all(has_default for _, _, has_default
+               in positional[len(arg_types):]):
+        # A required parameter would not receive an argument.
+        return False
+    if len(arg_types) > len(positional) and not var_positional:
+        return False
+    receivers = positional + var_positional * (len(arg_types) - len(positional))
+    return all(_is_subtype(arg_type, annotation)
+               for arg_type, (_, annotation, _) in zip(arg_types, receivers))
+
+
+def _is_subtype(cls: typing.Any, clsinfo: typing.Any) -> bool:
+    # Return whether cls is a subtype of clsinfo, where a missing, unknown or
+    # Any type on either side is compatible with anything.
+    return (_is_unknown(cls) or _is_unknown(clsinfo)
+            or subclass_of(cls, clsinfo))
+
+
+def _is_unknown(hint: typing.Any) -> bool:
+    return hint is Empty or hint is Unknown or hint is typing.Any
+
+
+def _to_type(annotation: typing.Any) -> typing.Any:
+    # An annotation of None means NoneType.
+    return NoneType if annotation is None else annotation
+
+
+# Imported last, since typish.functions._subclass_of depends on this module.
+from typish.functions._subclass_of import (
+    DEFAULT_CACHE_SIZE,
+    subclass_of,
+)
+
+_cache = lru_cache(maxsize=DEFAULT_CACHE_SIZE)(_is_compatible)
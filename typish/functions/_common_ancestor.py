@@ -1,4 +1,8 @@
 import typing
+from weakref import WeakKeyDictionary
+
+from typish._state import DEFAULT
+from typish.functions._get_mro import get_mro
 
 
 def common_ancestor(*args: object) -> type:
@@ -7,7 +11,11 @@ def common_ancestor(*args: object) -> type:
     :param args: any objects.
     :return: the ``type`` of the closest common ancestor of the given ``args``.
     """
-    return _common_ancestor(args, False)
+    if len(args) < 1:
+        raise TypeError('common_ancestor() requires at least 1 argument')
+    # Objects of which the type is fully determined by their class (such as
+    # instances of a custom class) are only typed once per class.
+    return _common_ancestor(_get_distinct_types(args, DEFAULT, None))
 
 
 def common_ancestor_of_types(*args: type) -> type:
@@ -16,21 +24,59 @@ def common_ancestor_of_types(*args: type) -> type:
     :param args: any classes.
     :return: the ``type`` of the closest common ancestor of the given ``args``.
     """
-    return _common_ancestor(args, True)
-
-
-def _common_ancestor(args: typing.Sequence[object], types: bool) -> type:
-    from typish.functions._get_type import get_type
-    from typish.functions._get_mro import get_mro
-
     if len(args) < 1:
         raise TypeError('common_ancestor() requires at least 1 argument')
-    tmap = (lambda x: x) if types else get_type
-    mros = [get_mro(tmap(elem)) for elem in args]
-    for cls in mros[0]:
-        for mro in mros:
-            if cls not in mro:
-                break
-        else:
+    return _common_ancestor(_distinct(args))
+
+
+def _common_ancestor(types: typing.Sequence[type]) -> type:
+    # Return the first class in the mro of the first type that is in the mro
+    # of all other types as well.
+    mro, _ = _get_mro_index(types[0])
+    other_mro_sets = [_get_mro_index(type_)[1] for type_ in types[1:]]
+    for cls in mro:
+        if all(cls in mro_set for mro_set in other_mro_sets):
             # cls is in every mro; a common ancestor is found!
             return cls
+
+
+def _distinct(types: typing.Sequence[type]) -> typing.Sequence[type]:
+    # Return types without duplicates, in order of appearance.
+    try:
+        return tuple(dict.fromkeys(types))
+    except TypeError:
+        # Some type is unhashable.
+        return types
+
+
+def _get_mro_index(
+        type_: type) -> typing.Tuple[typing.Tuple[type, ...],
+                                     typing.Container[type]]:
+    # Return the mro of type_ and a container of that mro for fast membership
+    # tests. These are cached per type until the mro of a class changes (i.e.
+    # when its __bases__ are reassigned).
+    try:
+        index = _mro_index_per_type.get(type_)
+    except TypeError:
+        index = None  # type_ cannot be weakly referenced or hashed.
+    if index and index[0] is getattr(type_, '__mro__', index[0]):
+        return index
+
+    mro = get_mro(type_)
+    try:
+        mro_set = frozenset(mro)
+    except TypeError:
+        mro_set = mro  # Some class in the mro is unhashable.
+    index = mro, mro_set
+    try:
+        _mro_index_per_type[type_] = index
+    except TypeError:
+        pass
+    return index
+
+
+# The mro and a set of that mro per type.
+_mro_index_per_type = WeakKeyDictionary()
+
+# Imported last, since typish.functions._get_type depends on this module.
+from typish.functions._get_type import _get_distinct_types
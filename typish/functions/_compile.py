@@ -0,0 +1,109 @@
+import typing
+
+from typish._capabilities import get_capabilities
+from typish._state import DEFAULT, State
+from typish.classes._checker import (
+    Checker,
+    _AnyNode,
+    _CallableNode,
+    _ClassNode,
+    _GenericNode,
+    _InstanceCheckNode,
+    _IterableNode,
+    _LiteralNode,
+    _MappingNode,
+    _Node,
+    _TupleNode,
+    _UnionNode,
+    _VariadicTupleNode,
+)
+from typish.classes._literal import is_literal_type
+from typish.functions._get_alias import get_alias
+
+
+def compile(hint: typing.Any, *, state: State = DEFAULT) -> Checker:
+    """
+    Compile the given type hint into a ``Checker``. A ``Checker`` can be
+    called with an object to check whether that object is an instance of
+    ``hint``. The hint is analyzed once, so that a ``Checker`` can be used to
+    check many objects cheaply.
+
+    Example:
+    ```
+    is_payload = compile(Dict[str, List[int]])
+    is_payload({'a': [1, 2, 3]})  # True
+    is_payload({'a': [1, 2, '3']})  # False
+    ```
+    :param hint: the type hint that is to be compiled.
+    :param state: any state that is used by typish.
+    :return: a ``Checker`` for ``hint``.
+    """
+    return Checker(hint, _compile_node(hint, state))
+
+
+def _compile_node(hint: typing.Any, state: State) -> _Node:
+    # Analyze hint and return a node that can check instances of it.
+    capabilities = get_capabilities(hint)
+    if not capabilities.is_from_typing and capabilities.has_instancecheck:
+        return _InstanceCheckNode(hint, state)
+
+    if is_literal_type(hint):
+        return _LiteralNode(hint, state, capabilities.literal_values)
+
+    if hint is typing.Any or hint is object:
+        return _AnyNode(hint, state)
+
+    alias_capabilities = get_capabilities(_get_alias(hint))
+    origin = alias_capabilities.origin
+    args = alias_capabilities.args
+
+    if origin is typing.Union:
+        options = [_compile_node(arg, state) for arg in args]
+        return _UnionNode(hint, state, options)
+
+    if origin is typing.Callable:
+        return _CallableNode(hint, state)
+
+    if origin is type or not _supports_isinstance(origin):
+        return _GenericNode(hint, state)
+
+    if not args:
+        return _ClassNode(hint, state, origin)
+
+    if origin is tuple:
+        if len(args) == 2 and args[1] is ...:
+            return _VariadicTupleNode(
+                hint, state, _compile_node(args[0], state))
+        elements = [_compile_node(arg, state) for arg in args]
+        return _TupleNode(hint, state, elements)
+
+    if len(args) == 1:
+        return _IterableNode(
+            hint, state, origin, _compile_node(args[0], state))
+
+    if len(args) == 2:
+        return _MappingNode(hint, state, origin,
+                            _compile_node(args[0], state),
+                            _compile_node(args[1], state))
+
+    return _GenericNode(hint, state)
+
+
+def _get_alias(hint: typing.Any) -> typing.Any:
+    # Translate hint to its typing equivalent (if any), like subclass_of does.
+    try:
+        return get_alias(hint) or hint
+    except (TypeError, AttributeError):
+        # Unhashable or otherwise exotic hints are taken as they are.
+        return hint
+
+
+def _supports_isinstance(origin: typing.Any) -> bool:
+    # Return whether origin can be used as second argument of isinstance.
+    if isinstance(origin, type):
+        return True
+    try:
+        isinstance(None, origin)
+    except TypeError:
+        return False
+    return True
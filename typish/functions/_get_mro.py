@@ -1,6 +1,8 @@
 import typing
 from inspect import getmro
 
+from typish.functions._get_origin import get_origin
+
 
 def get_mro(obj: typing.Any) -> typing.Tuple[type, ...]:
     """
@@ -9,8 +11,6 @@ def get_mro(obj: typing.Any) -> typing.Tuple[type, ...]:
     :param obj: object or type.
     :return: a tuple of base classes.
     """
-    from typish.functions._get_origin import get_origin
-
     # Wrapper around ``getmro`` to allow types from ``typing``.
     if obj is ...:
         return Ellipsis, object
@@ -3,6 +3,7 @@ from collections import deque, defaultdict
 from collections.abc import Set
 from inspect import isclass
 
+from typish.functions._get_simple_name import get_simple_name
 from typish.functions._is_from_typing import is_from_typing
 
 
@@ -13,8 +14,6 @@ def get_origin(t: type) -> type:
     :param t: the type of which the origin is to be found.
     :return: the origin of ``t`` or ``t`` if it is not generic.
     """
-    from typish.functions._get_simple_name import get_simple_name
-
     simple_name = get_simple_name(t)
     result = _type_per_alias.get(simple_name, None)
     if isclass(t) and not is_from_typing(t):
@@ -1,95 +1,258 @@
 import inspect
 import types
 import typing
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Sequence, Sized
+from itertools import chain, islice
+from weakref import WeakKeyDictionary
 
+from typish._callable_cache import cached_per_callable, is_lambda
 from typish._state import DEFAULT, State
 from typish._types import T, Unknown, KT, NoneType, Empty, VT
 from typish.classes._union_type import UnionType
+from typish.functions._get_alias import get_alias
 
 
 def get_type(
         inst: T,
         use_union: bool = False,
         *,
-        state: State = DEFAULT) -> typing.Type[T]:
+        state: State = DEFAULT,
+        sample: typing.Optional[int] = None) -> typing.Type[T]:
     """
     Return a type, complete with generics for the given ``inst``.
+
+    If ``sample`` is given, the element types of collections that hold more
+    than ``sample`` elements are inferred from at most ``sample`` of them. For
+    indexable collections (e.g. lists and tuples), the first half of the
+    sample is taken from the start of the collection and the rest is picked
+    at a fixed stride from the remainder. Of other collections (e.g. sets and
+    the keys of dicts), only the first ``sample`` elements are inspected. The
+    result is then a deterministic approximation that costs constant time for
+    collections of any size. Use ``get_sampled_type`` to also learn whether
+    the result is approximate.
     :param inst: the instance for which a type is to be returned.
     :param use_union: if ``True``, the resulting type can contain a union.
     :param state: any state that is used by typish.
+    :param sample: the maximum number of elements per collection that are
+    inspected, or ``None`` to inspect all elements.
     :return: the type of ``inst``.
     """
+    if sample is not None and not isinstance(sample, _Sample):
+        sample = _Sample(sample)
 
-    get_type_for_inst = state.get_type_per_cls.get(type(inst))
+    inst_cls = type(inst)
+    get_type_for_inst = state.get_type_function(inst_cls)
     if get_type_for_inst:
         return get_type_for_inst(inst)
 
     if inst is typing.Any:
         return typing.Any
 
-    if isinstance(inst, UnionType):
+    if inst_cls not in _NON_UNION_TYPES and isinstance(inst, UnionType):
         return UnionType
 
-    result = type(inst)
-    super_types = [
-        (dict, _get_type_dict),
-        (tuple, _get_type_tuple),
-        (str, lambda inst_, _, __: result),
-        (typing.Iterable, _get_type_iterable),
-        (types.FunctionType, _get_type_callable),
-        (types.MethodType, _get_type_callable),
-        (type, lambda inst_, _, __: typing.Type[inst]),
-    ]
-
     try:
-        for super_type, func in super_types:
-            if isinstance(inst, super_type):
-                result = func(inst, use_union, state)
-                break
+        result = _get_handler(inst_cls)(inst, use_union, state, sample)
     except Exception:
         # If anything went wrong, return the regular type.
         # This is to support 3rd party libraries.
-        return type(inst)
+        return inst_cls
     return result
 
 
+def get_sampled_type(
+        inst: T,
+        sample: int,
+        use_union: bool = False,
+        *,
+        state: State = DEFAULT) -> typing.Tuple[typing.Type[T], bool]:
+    """
+    Return the type of ``inst`` like ``get_type`` does with ``sample`` and
+    whether that type is an approximation.
+
+    Example:
+    ```
+    type_, is_approximate = get_sampled_type(list(range(1000)), 10)
+    # type_ is List[int]
+    # is_approximate is True
+    ```
+    :param inst: the instance for which a type is to be returned.
+    :param sample: the maximum number of elements per collection that are
+    inspected.
+    :param use_union: if ``True``, the resulting type can contain a union.
+    :param state: any state that is used by typish.
+    :return: a tuple of the type of ``inst`` and whether any collection in
+    ``inst`` held more elements than were inspected.
+    """
+    sample_ = _Sample(sample)
+    type_ = get_type(inst, use_union, state=state, sample=sample_)
+    return type_, sample_.is_approximate
+
+
+class _Sample:
+    # The sample size of a call of get_type. It is passed on to the nested
+    # calls and records whether any collection was sampled.
+    __slots__ = ('size', 'is_approximate')
+
+    def __init__(self, size: int) -> None:
+        if size < 1:
+            raise ValueError('The sample size must be at least 1, got {}.'
+                             .format(size))
+        self.size = size
+        self.is_approximate = False
+
+
+def _get_handler(cls: type) -> typing.Callable[..., type]:
+    # Return the function that infers the type of instances of cls.
+    try:
+        handler = _handler_per_cls.get(cls)
+    except TypeError:
+        # An unhashable class; it cannot be cached.
+        return _resolve_handler(cls)
+    if not handler:
+        handler = _resolve_handler(cls)
+        _handler_per_cls[cls] = handler
+    return handler
+
+
+def _resolve_handler(cls: type) -> typing.Callable[..., type]:
+    # Return the first handler for a type of which cls is a subclass.
+    for super_type, handler in _handlers:
+        if issubclass(cls, super_type):
+            return handler
+    return _get_type_default
+
+
+def _get_type_default(
+        inst: typing.Any,
+        use_union: bool,
+        state: State,
+        sample: typing.Optional[_Sample]) -> type:
+    return type(inst)
+
+
+def _get_type_type(
+        inst: type,
+        use_union: bool,
+        state: State,
+        sample: typing.Optional[_Sample]) -> type:
+    return typing.Type[inst]
+
+
 def _get_type_iterable(
         inst: typing.Iterable,
         use_union: bool,
-        state: State) -> type:
-    from typish.functions._get_alias import get_alias
-    from typish.functions._common_ancestor import common_ancestor
-
+        state: State,
+        sample: typing.Optional[_Sample]) -> type:
     typing_type = get_alias(type(inst))
     common_cls = Unknown
     if inst:
-        if use_union:
-            types = [get_type(elem, state=state) for elem in inst]
-            common_cls = typing.Union[tuple(types)]
-        else:
-            common_cls = common_ancestor(*inst)
-            if typing_type:
-                if issubclass(common_cls, typing.Iterable) and typing_type is not str:
-                    # Get to the bottom of it; obtain types recursively.
-                    common_cls = get_type(common_cls(_flatten(inst)), state=state)
+        common_cls = _get_type_elements(
+            lambda: inst, typing_type, use_union, state, sample)
     result = typing_type[common_cls]
     return result
 
 
+def _get_type_elements(
+        get_elems: typing.Callable[[], typing.Iterable],
+        typing_type: typing.Optional[type],
+        use_union: bool,
+        state: State,
+        sample: typing.Optional[_Sample]) -> type:
+    # Return the type of the elements that get_elems() yields, or Unknown if
+    # it yields nothing. The elements are streamed, only their distinct types
+    # are kept.
+    if use_union:
+        types = _get_distinct_types(get_elems(), state, sample)
+        return typing.Union[tuple(types)] if types else Unknown
+
+    types = _get_distinct_types(get_elems(), DEFAULT, sample)
+    if not types:
+        return Unknown
+    common_cls = common_ancestor_of_types(*types)
+    if typing_type:
+        if issubclass(common_cls, typing.Iterable) and typing_type is not str:
+            # Get to the bottom of it; obtain types recursively.
+            if (common_cls is list
+                    and not state.get_type_function(list)):
+                common_cls = _get_type_flattened(get_elems, state, sample)
+            else:
+                elems = _sample(get_elems(), sample)
+                common_cls = get_type(common_cls(_flatten(elems)),
+                                      state=state, sample=sample)
+    return common_cls
+
+
+def _get_type_flattened(
+        get_elems: typing.Callable[[], typing.Iterable[list]],
+        state: State,
+        sample: typing.Optional[_Sample]) -> type:
+    # Return what get_type would return for a list with all the elements of
+    # the lists that get_elems() yields, without creating that list.
+    def _get_flattened_elems() -> typing.Iterable:
+        lists = _sample(get_elems(), sample)
+        return chain.from_iterable(_sample(elems, sample) for elems in lists)
+
+    try:
+        elem_type = _get_type_elements(
+            _get_flattened_elems, typing.List, False, state, sample)
+        result = typing.List[elem_type]
+    except Exception:
+        # The same fallback as in get_type.
+        result = list
+    return result
+
+
+def _get_distinct_types(
+        elems: typing.Iterable,
+        state: State,
+        sample: typing.Optional[_Sample]) -> typing.Tuple[type, ...]:
+    # Return the distinct types of elems in order of appearance. Elements of
+    # which the type is fully determined by their class are typed once.
+    result = OrderedDict()
+    type_per_leaf_cls = {}
+    for elem in _sample(elems, sample):
+        elem_cls = type(elem)
+        type_ = type_per_leaf_cls.get(elem_cls)
+        if type_ is None:
+            type_ = get_type(elem, state=state, sample=sample)
+            if _is_leaf_cls(elem_cls, state):
+                type_per_leaf_cls[elem_cls] = type_
+        result[type_] = None
+    return tuple(result)
+
+
+def _is_leaf_cls(cls: type, state: State) -> bool:
+    # Return whether get_type gives the same result for all instances of cls.
+    return (not state.get_type_function(cls)
+            and cls.__module__ != typing.__name__
+            and (issubclass(cls, str) or not issubclass(cls, _NON_LEAF_TYPES)))
+
+
 def _get_type_tuple(
         inst: tuple,
         use_union: bool,
-        state: State) -> typing.Dict[KT, VT]:
-    args = [get_type(elem, state) for elem in inst]
+        state: State,
+        sample: typing.Optional[_Sample]) -> typing.Dict[KT, VT]:
+    args = [get_type(elem, state, sample=sample) for elem in inst]
     return typing.Tuple[tuple(args)]
 
 
 def _get_type_callable(
         inst: typing.Callable,
         use_union: bool,
-        state: State) -> typing.Type[typing.Dict[KT, VT]]:
-    if 'lambda' in str(inst):
-        result = _get_type_lambda(inst, use_union, state)
+        state: State,
+        sample: typing.Optional[_Sample]) -> typing.Type[typing.Dict[KT, VT]]:
+    return _get_callable_type(inst)
+
+
+@cached_per_callable
+def _get_callable_type(inst: typing.Callable) -> type:
+    # Return the type of a function or method. This depends on the signature
+    # only, so it is cached per function.
+    if is_lambda(inst):
+        result = _get_type_lambda(inst)
     else:
         result = typing.Callable
         sig = inspect.signature(inst)
@@ -105,10 +268,7 @@ def _get_type_callable(
     return result
 
 
-def _get_type_lambda(
-        inst: typing.Callable,
-        use_union: bool,
-        state: State) -> typing.Type[typing.Dict[KT, VT]]:
+def _get_type_lambda(inst: typing.Callable) -> type:
     args = [Unknown for _ in inspect.signature(inst).parameters]
     return_type = Unknown
     return typing.Callable[args, return_type]
@@ -116,14 +276,44 @@ def _get_type_lambda(
 
 def _get_type_dict(inst: typing.Dict[KT, VT],
                    use_union: bool,
-                   state: State) -> typing.Type[typing.Dict[KT, VT]]:
-    from typish.functions._get_args import get_args
+                   state: State,
+                   sample: typing.Optional[_Sample]) -> typing.Type[typing.Dict[KT, VT]]:
+    keys = inst.keys()
+    values = inst.values()
+    if sample:
+        keys = list(_sample(keys, sample))
+        values = [inst[key] for key in keys]
+    t_k = _get_type_elements(
+        lambda: keys, typing.List, use_union, state, sample)
+    t_v = _get_type_elements(
+        lambda: values, typing.List, use_union, state, sample)
+    return typing.Dict[t_k, t_v]
+
 
-    t_list_k = _get_type_iterable(list(inst.keys()), use_union, state)
-    t_list_v = _get_type_iterable(list(inst.values()), use_union, state)
-    t_k_tuple = get_args(t_list_k)
-    t_v_tuple = get_args(t_list_v)
-    return typing.Dict[t_k_tuple[0], t_v_tuple[0]]
+def _sample(
+        elems: typing.Iterable[T],
+        sample: typing.Optional[_Sample]) -> typing.Iterable[T]:
+    # Return at most sample.size elements of elems: a prefix, followed by
+    # picks at a fixed stride from the remainder if elems supports indexing.
+    # Of other iterables, only a prefix is returned.
+    if sample is None:
+        return elems
+    size = sample.size
+    if isinstance(elems, Sized) and len(elems) <= size:
+        return elems
+    if not isinstance(elems, Sequence):
+        result = list(islice(elems, size + 1))
+        if len(result) > size:
+            sample.is_approximate = True
+            result.pop()
+        return result
+    sample.is_approximate = True
+    prefix_size = (size + 1) // 2
+    picks_count = size - prefix_size
+    stride = (len(elems) - prefix_size) / picks_count if picks_count else 0
+    return ([elems[i] for i in range(prefix_size)]
+            + [elems[prefix_size + int(i * stride)]
+               for i in range(picks_count)])
 
 
 def _flatten(l: typing.Iterable[typing.Iterable[typing.Any]]) -> typing.List[typing.Any]:
@@ -138,3 +328,50 @@ def _map_empty(annotation: type) -> type:
     if annotation == Empty:
         result = typing.Any
     return result
+
+
+# Instances of these types (except str) may get a different type from
+# get_type than other instances of the same class.
+_NON_LEAF_TYPES = (
+    dict,
+    tuple,
+    Iterable,
+    type,
+    types.FunctionType,
+    types.MethodType,
+)
+
+# The handlers of get_type in order of precedence.
+_handlers = (
+    (dict, _get_type_dict),
+    (tuple, _get_type_tuple),
+    (str, _get_type_default),
+    (Iterable, _get_type_iterable),
+    (types.FunctionType, _get_type_callable),
+    (types.MethodType, _get_type_callable),
+    (type, _get_type_type),
+)
+
+# The resolved handler per class.
+_handler_per_cls = WeakKeyDictionary()
+
+# The instances of these types never represent a typing.Union.
+_NON_UNION_TYPES = {
+    bool,
+    bytes,
+    deque,
+    dict,
+    float,
+    frozenset,
+    int,
+    list,
+    NoneType,
+    set,
+    tuple,
+}
+
+# Imported last, since typish.functions._common_ancestor depends on this
+# module.
+from typish.functions._common_ancestor import (
+    common_ancestor_of_types,
+)
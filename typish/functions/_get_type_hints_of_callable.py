@@ -1,13 +1,22 @@
 import typing
 
+from typish._callable_cache import cached_per_callable
+
 
 def get_type_hints_of_callable(
         func: typing.Callable) -> typing.Dict[str, type]:
     """
-    Return the type hints of the parameters of the given callable.
+    Return the type hints of the parameters of the given callable. For
+    functions and methods, the hints are evaluated once and cached until the
+    annotations of the function change.
     :param func: the callable of which the type hints are to be returned.
     :return: a dict with parameter names and their types.
     """
+    return dict(_get_type_hints(func))
+
+
+@cached_per_callable
+def _get_type_hints(func: typing.Callable) -> typing.Dict[str, type]:
     # Python3.5: get_type_hints raises on classes without explicit constructor
     try:
         result = typing.get_type_hints(func)
@@ -1,4 +1,5 @@
 from typish._state import DEFAULT, State
+from typish.functions._compile import _compile_node
 
 
 def instance_of(obj: object, *args: object, state: State = DEFAULT) -> bool:
@@ -6,6 +7,10 @@ def instance_of(obj: object, *args: object, state: State = DEFAULT) -> bool:
     Check whether ``obj`` is an instance of all types in ``args``, while also
     considering generics.
 
+    The check walks ``obj`` along the structure of each type and stops at the
+    first element that does not match. Objects for which no structural check
+    exists have their type inferred by ``get_type`` instead.
+
     If you want the instance check to be customized for your type, then make
     sure it has a __instancecheck__ defined (not in a base class). You will
     also need to register the get_type function by calling
@@ -19,17 +24,4 @@ def instance_of(obj: object, *args: object, state: State = DEFAULT) -> bool:
 
 
 def _instance_of(obj: object, clsinfo: object, state: State = DEFAULT) -> bool:
-    from typish.classes._literal import LiteralAlias, is_literal_type
-    from typish.functions._subclass_of import subclass_of
-    from typish.functions._get_type import get_type
-    from typish.functions._is_from_typing import is_from_typing
-
-    if not is_from_typing(clsinfo) and '__instancecheck__' in dir(clsinfo):
-        return isinstance(obj, clsinfo)
-
-    if is_literal_type(clsinfo):
-        alias = LiteralAlias.from_literal(clsinfo)
-        return isinstance(obj, alias)
-
-    type_ = get_type(obj, use_union=True, state=state)
-    return subclass_of(type_, clsinfo)
+    return _compile_node(clsinfo, state)(obj)
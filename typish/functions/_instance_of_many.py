@@ -0,0 +1,182 @@
+import os
+import pickle
+import sys
+import typing
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import lru_cache, partial
+from itertools import chain, islice
+
+from typish._state import DEFAULT, State
+from typish.functions._compile import compile
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def instance_of_many(
+        objs: typing.Iterable[object],
+        *args: object,
+        state: State = DEFAULT) -> typing.List[bool]:
+    """
+    Check for each object in ``objs`` whether it is an instance of all types
+    in ``args``, like ``instance_of`` does. The types are analyzed only once
+    for the whole batch and ``objs`` is consumed as a stream, so it can be a
+    generator.
+    :param objs: the objects in subject.
+    :param args: the type(s) of which each object is an instance or not.
+    :param state: any state that is used by typish.
+    :return: a list with a ``bool`` for each object in ``objs``.
+    """
+    checkers = _compile_all(args, state)
+    return [all(checker(obj) for checker in checkers) for obj in objs]
+
+
+def instance_of_many_failures(
+        objs: typing.Iterable[object],
+        *args: object,
+        state: State = DEFAULT) -> typing.List[int]:
+    """
+    Return the indices of the objects in ``objs`` that are not an instance of
+    all types in ``args``. Like ``instance_of_many``, the types are analyzed
+    only once and ``objs`` is consumed as a stream.
+    :param objs: the objects in subject.
+    :param args: the type(s) of which each object is an instance or not.
+    :param state: any state that is used by typish.
+    :return: a list with the indices of the objects that failed the check.
+    """
+    checkers = _compile_all(args, state)
+    return [index for index, obj in enumerate(objs)
+            if not all(checker(obj) for checker in checkers)]
+
+
+def instance_of_many_parallel(
+        objs: typing.Iterable[object],
+        *args: object,
+        executor: typing.Optional[Executor] = None,
+        max_workers: typing.Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        state: State = DEFAULT) -> typing.List[bool]:
+    """
+    Like ``instance_of_many``, but split ``objs`` in chunks that are checked
+    in parallel. If ``executor`` is not given, a ``ProcessPoolExecutor`` is
+    used that receives the types only once per worker process (with every
+    chunk before Python 3.7). Inputs that fit in one chunk are checked
+    serially.
+
+    The types, ``state`` (if not the default) and the objects must be
+    picklable when processes are used. With a ``ThreadPoolExecutor``, nothing
+    is pickled and the types are compiled only once. Other executors receive
+    the pickled types with every chunk.
+    :param objs: the objects in subject.
+    :param args: the type(s) of which each object is an instance or not.
+    :param executor: an executor to check the chunks with.
+    :param max_workers: the maximum number of processes if no ``executor``
+    is given. At most twice this number of chunks (default: twice the number
+    of CPUs) is submitted at any time, also to a given ``executor``.
+    :param chunk_size: the number of objects that is checked per task.
+    :param state: any state that is used by typish.
+    :return: a list with a ``bool`` for each object in ``objs``, in order.
+    """
+    if chunk_size < 1:
+        raise ValueError('The chunk size must be at least 1, got {}.'
+                         .format(chunk_size))
+
+    chunks = _chunks(objs, chunk_size)
+    first_chunks = list(islice(chunks, 2))
+    if len(first_chunks) < 2:
+        # Not worth the overhead of going parallel.
+        return instance_of_many(
+            first_chunks[0] if first_chunks else [], *args, state=state)
+
+    all_chunks = chain(first_chunks, chunks)
+    max_in_flight = 2 * (max_workers or os.cpu_count() or 1)
+    if isinstance(executor, ThreadPoolExecutor):
+        # Threads share the compiled types; there is no need to pickle.
+        check_chunk = partial(_check_objs, _compile_all(args, state))
+        return _check_chunks(executor, check_chunk, all_chunks, max_in_flight)
+
+    # Use None for the default state, so that workers use their own default.
+    payload = pickle.dumps((args, None if state is DEFAULT else state))
+    check_chunk = partial(_check_chunk, payload)
+    if executor:
+        return _check_chunks(executor, check_chunk, all_chunks, max_in_flight)
+    if sys.version_info < (3, 7):
+        # Workers cannot be initialized; send the payload with every chunk.
+        with ProcessPoolExecutor(max_workers=max_workers) as executor_:
+            return _check_chunks(executor_, check_chunk, all_chunks,
+                                 max_in_flight)
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             initializer=_init_worker,
+                             initargs=(payload,)) as executor_:
+        return _check_chunks(executor_, partial(_check_chunk, None),
+                             all_chunks, max_in_flight)
+
+
+def _check_chunks(
+        executor: Executor,
+        check_chunk: typing.Callable[[typing.List[object]], typing.List[bool]],
+        chunks: typing.Iterable[typing.List[object]],
+        max_in_flight: int) -> typing.List[bool]:
+    # Submit the chunks to executor, while keeping a limited number of chunks
+    # in flight, and merge their results in order.
+    result = []
+    in_flight = deque()
+    for chunk in chunks:
+        in_flight.append(executor.submit(check_chunk, chunk))
+        if len(in_flight) >= max_in_flight:
+            result += in_flight.popleft().result()
+    while in_flight:
+        result += in_flight.popleft().result()
+    return result
+
+
+def _check_chunk(
+        payload: typing.Optional[bytes],
+        chunk: typing.List[object]) -> typing.List[bool]:
+    # Check a chunk in a worker. A payload of None means that the payload was
+    # given to the worker upon initialization.
+    return _check_objs(_load_checkers(payload or _worker_payload), chunk)
+
+
+def _check_objs(
+        checkers: typing.List[typing.Callable[[object], bool]],
+        objs: typing.List[object]) -> typing.List[bool]:
+    return [all(checker(obj) for checker in checkers) for obj in objs]
+
+
+@lru_cache(maxsize=16)
+def _load_checkers(
+        payload: bytes) -> typing.List[typing.Callable[[object], bool]]:
+    # Unpickle the payload and compile its types, once per worker.
+    args, state = pickle.loads(payload)
+    return _compile_all(args, state or DEFAULT)
+
+
+def _init_worker(payload: bytes) -> None:
+    # Store the payload of types and state in a worker process.
+    global _worker_payload
+    _worker_payload = payload
+
+
+def _chunks(
+        objs: typing.Iterable[object],
+        chunk_size: int) -> typing.Iterator[typing.List[object]]:
+    iterator = iter(objs)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
+
+
+def _compile_all(
+        args: typing.Tuple[object, ...],
+        state: State) -> typing.List[typing.Callable[[object], bool]]:
+    return [compile(arg, state=state) for arg in args]
+
+
+# The payload of types and state that was given to this (worker) process.
+_worker_payload = None
@@ -1,6 +1,8 @@
 import typing
 
-from typish import get_origin, get_args, NoneType
+from typish._types import NoneType
+from typish.functions._get_args import get_args
+from typish.functions._get_origin import get_origin
 
 
 def is_optional_type(cls: type) -> bool:
@@ -1,6 +1,7 @@
 import typing
 
 from typish.classes._union_type import UnionType
+from typish.functions._instance_of import instance_of
 
 
 def is_type_annotation(item: typing.Any) -> bool:
@@ -10,8 +11,6 @@ def is_type_annotation(item: typing.Any) -> bool:
     :param item: the item in question.
     :return: ``True`` is ``item`` is a type annotation.
     """
-    from typish.functions._instance_of import instance_of
-
     # Use _GenericAlias for Python 3.7+ and use GenericMeta for the rest.
     super_cls = getattr(typing, '_GenericAlias',
                         getattr(typing, 'GenericMeta', None))
@@ -1,8 +1,15 @@
 import typing
+from abc import get_cache_token
+from functools import lru_cache
 
+from typish._capabilities import get_capabilities
 from typish._types import Unknown
+from typish.classes._literal import LiteralAlias
+from typish.functions._common_ancestor import common_ancestor_of_types
 from typish.functions._get_alias import get_alias
 
+DEFAULT_CACHE_SIZE = 4096
+
 
 def subclass_of(cls: object, *args: object) -> bool:
     """
@@ -15,14 +22,52 @@ def subclass_of(cls: object, *args: object) -> bool:
     :param args: the super types.
     :return: True if ``cls`` is a subclass of all types in ``args`` while also
     considering generics.
+
+    Results are memoized in a LRU cache of ``DEFAULT_CACHE_SIZE`` entries. Use
+    ``subclass_of.cache_info()`` and ``subclass_of.cache_clear()`` to inspect
+    or clear it and ``subclass_of.set_cache_size(maxsize)`` to resize it.
     """
-    return all(_subclass_of(cls, clsinfo) for clsinfo in args)
+    return all(_cached_subclass_of(cls, clsinfo) for clsinfo in args)
+
+
+def _cached_subclass_of(cls: type, clsinfo: object) -> bool:
+    # Return the (cached) result of _subclass_of for cls and clsinfo.
+    global _abc_cache_token
+    cache_token = get_cache_token()
+    if cache_token != _abc_cache_token:
+        # An ABC got a new virtual subclass, which may change any result.
+        _cache.cache_clear()
+        _abc_cache_token = cache_token
+    try:
+        return _cache(cls, clsinfo)
+    except TypeError:
+        try:
+            hash((cls, clsinfo))
+        except TypeError:
+            # Unhashable types cannot be cached.
+            return _subclass_of(cls, clsinfo)
+        raise
+
+
+def _cache_info() -> typing.Any:
+    # Return the statistics of the cache of subclass_of.
+    return _cache.cache_info()
+
+
+def _cache_clear() -> None:
+    # Clear the cache of subclass_of.
+    _cache.cache_clear()
+
+
+def _set_cache_size(maxsize: typing.Optional[int]) -> None:
+    # Replace the cache of subclass_of by an empty one of the given size. A
+    # maxsize of None means that the cache is unbounded.
+    global _cache
+    _cache = lru_cache(maxsize=maxsize)(_subclass_of)
 
 
 def _subclass_of(cls: type, clsinfo: object) -> bool:
     # Check whether cls is a subtype of clsinfo.
-    from typish.classes._literal import LiteralAlias
-
     # Translate to typing type if possible.
     clsinfo = get_alias(clsinfo) or clsinfo
 
@@ -42,17 +87,16 @@ def _forward_subclass_check(cls: type, clsinfo: type) -> bool:
     # Forward the subclass check for cls and clsinfo to delegates that know how
     # to check that particular cls/clsinfo type.
 
-    from typish.functions._get_origin import get_origin
-    from typish.functions._get_args import get_args
-
-    clsinfo_origin = get_origin(clsinfo)
-    clsinfo_args = get_args(clsinfo)
-    cls_origin = get_origin(cls)
+    clsinfo_capabilities = get_capabilities(clsinfo)
+    clsinfo_origin = clsinfo_capabilities.origin
+    clsinfo_args = clsinfo_capabilities.args
+    cls_capabilities = get_capabilities(cls)
+    cls_origin = cls_capabilities.origin
 
     if cls_origin is typing.Union:
         # cls is a Union; all options of that Union must subclass clsinfo.
-        cls_args = get_args(cls)
-        result = all([subclass_of(elem, clsinfo) for elem in cls_args])
+        result = all([subclass_of(elem, clsinfo)
+                      for elem in cls_capabilities.args])
     elif clsinfo_args:
         result = _subclass_of_generic(cls, clsinfo_origin, clsinfo_args)
     else:
@@ -70,12 +114,10 @@ def _subclass_of_generic(
     # Check if cls is a subtype of info_generic_type, knowing that the latter
     # is a generic type.
 
-    from typish.functions._get_origin import get_origin
-    from typish.functions._get_args import get_args
-
     result = False
-    cls_origin = get_origin(cls)
-    cls_args = get_args(cls)
+    cls_capabilities = get_capabilities(cls)
+    cls_origin = cls_capabilities.origin
+    cls_args = cls_capabilities.args
     if info_generic_type is tuple:
         # Special case.
         result = (subclass_of(cls_origin, tuple)
@@ -83,6 +125,11 @@ def _subclass_of_generic(
     elif info_generic_type is typing.Union:
         # Another special case.
         result = any(subclass_of(cls, cls_) for cls_ in info_args)
+    elif (info_generic_type is typing.Callable
+          and cls_origin is typing.Callable and cls_args):
+        # Another special case: parameters are contravariant. Other types
+        # (e.g. classes) are checked like any generic below.
+        result = _subclass_of_callable(cls, info_args)
     elif cls_origin is tuple and info_generic_type is typing.Iterable:
         # Another special case.
         args = _tuple_args(cls_args)
@@ -98,15 +145,19 @@ def _subclass_of_generic(
     return result
 
 
+def _subclass_of_callable(
+        cls: type,
+        info_args: typing.Tuple[type, ...]) -> bool:
+    return is_shape_compatible(get_shape_of_hint(cls), info_args[:-1],
+                               info_args[-1])
+
+
 def _subclass_of_tuple(
         cls_args: typing.Tuple[type, ...],
         info_args: typing.Tuple[type, ...]) -> bool:
-    from typish.functions._get_origin import get_origin
-    from typish.functions._common_ancestor import common_ancestor_of_types
-
     result = False
     if len(info_args) == 2 and info_args[1] is ...:
-        type_ = get_origin(info_args[0])
+        type_ = get_capabilities(info_args[0]).origin
         if type_ is typing.Union:
             # A heterogeneous tuple: check each element if it subclasses the
             # union.
@@ -141,12 +192,10 @@ def _is_true_case(cls: type, clsinfo: type) -> bool:
 def is_issubclass_case(cls: type, clsinfo: type) -> bool:
     # Return whether subclass_of(cls, clsinfo) holds a case that can be handled
     # by the builtin issubclass.
-    from typish.functions._is_from_typing import is_from_typing
-
-    return (not is_from_typing(clsinfo)
-            and isinstance(cls, type)
-            and clsinfo is not type
-            and '__subclasscheck__' in dir(clsinfo))
+    if not isinstance(cls, type) or clsinfo is type:
+        return False
+    capabilities = get_capabilities(clsinfo)
+    return not capabilities.is_from_typing and capabilities.has_subclasscheck
 
 
 def _tuple_args(
@@ -156,3 +205,17 @@ def _tuple_args(
     if len(cls_args) > 1 and cls_args[1] is ...:
         result = [cls_args[0]]
     return result
+
+
+_cache = lru_cache(maxsize=DEFAULT_CACHE_SIZE)(_subclass_of)
+_abc_cache_token = get_cache_token()
+subclass_of.cache_info = _cache_info
+subclass_of.cache_clear = _cache_clear
+subclass_of.set_cache_size = _set_cache_size
+
+# Imported last, since typish.functions._callable_compatibility depends on this
+# module.
+from typish.functions._callable_compatibility import (
+    get_shape_of_hint,
+    is_shape_compatible,
+)